@@ -73,6 +73,10 @@ setup(
         'examples': [
             'jupyter>=1.0',
             'ipykernel>=6.0'
+        ],
+        'performance': [
+            'numba>=0.56.0',
+            'orjson>=3.6.0'
         ]
     },
     entry_points={
@@ -13,7 +13,7 @@ from .data_loader import (
 
 # Import heavy modules only when needed
 try:
-    from .models.tourism_model import TourismModel, ScenarioAwareTourismModel
+    from .models.tourism_model import TourismModel, ScenarioAwareTourismModel, run_batch
     from .models.scenario_manager import ScenarioManager, TourismScenario
     from .agents.tourist import Tourist, ScenarioAwareTourist
     from .agents.hotspot import Hotspot, ScenarioAwareHotspot
@@ -38,6 +38,7 @@ if HEAVY_IMPORTS_AVAILABLE:
     __all__.extend([
         'TourismModel',
         'ScenarioAwareTourismModel',
+        'run_batch',
         'ScenarioManager', 
         'TourismScenario',
         'Tourist',
@@ -20,6 +20,19 @@ class Hotspot(Agent):
     appeal scores, and dynamic popularity based on visitor interactions.
     """
 
+    # Every attribute is assigned in __init__; the Mesa base attributes
+    # (model, unique_id, pos) stay in the instance __dict__.
+    __slots__ = (
+        "name", "description", "category",
+        "x", "y", "neighborhood",
+        "initial_popularity", "current_popularity", "base_capacity", "capacity",
+        "accessibility_level", "appeal_to_personas",
+        "amenities", "operating_hours", "seasonal_variation",
+        "visitors_today", "total_visitors", "social_shares",
+        "popularity_history", "satisfaction_ratings",
+        "social_media_boost", "decay_rate", "capacity_penalty", "viral_threshold",
+    )
+
     def __init__(self, model, hotspot_data: Dict[str, Any]):
         """
         Initialize a hotspot agent with LLM-generated data.
@@ -172,6 +185,12 @@ class ScenarioAwareHotspot(Hotspot):
     allowing dynamic adaptation to policy changes and external events.
     """
 
+    __slots__ = (
+        "base_appeal_to_personas", "effective_capacity", "accessibility_modifier",
+        "scenario_appeal_modifiers", "scenario_satisfaction_modifiers",
+        "active_events", "processed_events",
+    )
+
     def __init__(self, model, hotspot_data: Dict[str, Any]):
         """Initialize scenario-aware hotspot with additional adaptation capabilities."""
         super().__init__(model, hotspot_data)
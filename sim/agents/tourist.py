@@ -6,11 +6,69 @@ This module defines tourist agent classes with LLM-generated persona behaviors
 and scenario-aware adaptations.
 """
 
-import random
 import numpy as np
 from mesa import Agent
 from typing import Dict, List, Optional, Any
 
+# Positions in ScenarioAwareTourist.scenario_modifiers
+SATISFACTION_MOD = 0
+APPEAL_SENS = 1
+COST_SENS = 2
+CROWDING_TOL = 3
+SHARE_BOOST = 4
+
+# Modifiers with no scenario effect applied
+_NEUTRAL_SCENARIO_MODIFIERS = np.array([0.0, 1.0, 1.0, 1.0, 1.0])
+
+# numba is optional; without it hotspot scoring uses the NumPy path
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _score_and_pick(appeal, popularity, rec_boost, x, y, hs_pos,
+                    visited_mask, exploration_tendency, u):
+    """
+    Score every hotspot for one tourist and sample one in a single loop.
+
+    Performs the same operations in the same order as
+    Tourist._score_and_pick_numpy, so both paths pick the same hotspot.
+
+    Returns:
+        Index of the chosen hotspot, or -1 if every score is zero
+    """
+    n = appeal.shape[0]
+    cdf = np.empty(n)
+    total = 0.0
+    for j in range(n):
+        score = appeal[j] + popularity[j] * 0.3
+        score += rec_boost[j]
+        dx = hs_pos[j, 0] - x
+        dy = hs_pos[j, 1] - y
+        score -= np.sqrt(dx * dx + dy * dy) * 0.05
+        if not visited_mask[j]:
+            score += 0.2 * exploration_tendency
+        if score < 0.0:
+            score = 0.0
+        total += score
+        cdf[j] = total
+
+    if total <= 0.0:
+        return -1
+    r = u * total
+    for j in range(n):
+        if cdf[j] > r:
+            return j
+    return n - 1
+
+
+if NUMBA_AVAILABLE:
+    # No fastmath: reassociating the sums would make picks depend on
+    # whether numba is installed
+    _score_and_pick = njit(cache=True)(_score_and_pick)
+
 
 class Tourist(Agent):
     """
@@ -20,6 +78,21 @@ class Tourist(Agent):
     and interaction patterns based on LLM-generated persona profiles.
     """
 
+    # Every attribute is assigned in __init__; the Mesa base attributes
+    # (model, unique_id, pos) stay in the instance __dict__.
+    __slots__ = (
+        "persona_type", "description",
+        "budget_level", "age_group", "origin", "group_size",
+        "interests",
+        "social_influence", "recommendation_trust", "exploration_tendency", "price_sensitivity",
+        "daily_visits", "movement_speed", "sharing_probability",
+        "influence_on_similar", "influence_on_different",
+        "current_hotspot", "visited_hotspots", "satisfaction",
+        "recommendations_received", "visits_today", "total_visits",
+        "visit_history", "_t_idx", "_persona_idx", "_rec_boost", "_visited_mask",
+        "_has_grid",
+    )
+
     def __init__(self, model, persona_data: Dict[str, Any]):
         """
         Initialize a tourist agent with LLM-generated persona data.
@@ -61,12 +134,28 @@ class Tourist(Agent):
 
         # Dynamic state
         self.current_hotspot = None
-        self.visited_hotspots = []
+        self.visited_hotspots = set()
+        self.visit_history = []
         self.satisfaction = 0.5
-        self.recommendations_received = []
+        self.recommendations_received = 0
         self.visits_today = 0
         self.total_visits = 0
 
+        # Row of this tourist in the model's per-tourist arrays
+        self._t_idx = len(model.tourists)
+
+        # Row of this persona in the model's appeal matrix
+        self._persona_idx = model.persona_index[self.persona_type]
+
+        # Trust-weighted recommendation strength received per hotspot
+        self._rec_boost = np.zeros(len(model.hotspots))
+
+        # Hotspots visited so far, aligned with the model's hotspot arrays
+        self._visited_mask = np.zeros(len(model.hotspots), dtype=bool)
+
+        # Resolved once instead of on every move and recommendation
+        self._has_grid = hasattr(model, 'grid')
+
     def step(self):
         """Execute one step of tourist behavior."""
         if self.visits_today < self.daily_visits:
@@ -82,86 +171,123 @@ class Tourist(Agent):
         Uses LLM-generated appeal scores and behavioral parameters to make
         realistic destination choices.
         """
-        available_hotspots = [agent for agent in self.model.agents 
-                            if hasattr(agent, 'appeal_to_personas')]
+        available_hotspots = self.model.hotspots
 
         if not available_hotspots:
             return
 
-        scores = {}
-        for hotspot in available_hotspots:
-            # Base appeal from LLM-generated persona-hotspot mappings
-            base_score = hotspot.get_persona_appeal(self.persona_type)
-
-            # Popularity influence
-            popularity_score = hotspot.current_popularity * 0.3
-
-            # Social recommendations
-            rec_score = 0
-            for rec in self.recommendations_received:
-                if rec["hotspot_id"] == hotspot.unique_id:
-                    rec_score += rec["strength"] * self.recommendation_trust
-
-            # Distance penalty
-            if hasattr(self, 'pos') and self.pos and hasattr(hotspot, 'pos'):
-                distance = np.sqrt((self.pos[0] - hotspot.pos[0])**2 + 
-                                 (self.pos[1] - hotspot.pos[1])**2)
-                distance_penalty = distance * 0.05
-            else:
-                distance_penalty = 0
-
-            # Exploration bonus
-            exploration_bonus = 0.2 if hotspot.unique_id not in self.visited_hotspots else 0
-            exploration_bonus *= self.exploration_tendency
+        model = self.model
 
-            total_score = base_score + popularity_score + rec_score - distance_penalty + exploration_bonus
-            scores[hotspot.unique_id] = max(0, total_score)
+        # Popularity influence is read live; it changes as tourists share
+        popularity = np.fromiter(
+            (h.current_popularity for h in model.hotspots), dtype=np.float64, count=len(model.hotspots)
+        )
+        u = np.random.random()
 
-        # Probabilistic choice based on scores
-        if scores and sum(scores.values()) > 0:
-            hotspot_ids = list(scores.keys())
-            weights = list(scores.values())
-            chosen_id = np.random.choice(hotspot_ids, p=np.array(weights)/sum(weights))
+        if NUMBA_AVAILABLE and self.pos is not None:
+            chosen_idx = _score_and_pick(
+                model.appeal_matrix[self._persona_idx], popularity, self._rec_boost,
+                float(self.pos[0]), float(self.pos[1]), model._hs_pos,
+                self._visited_mask, float(self.exploration_tendency), u
+            )
+        else:
+            chosen_idx = self._score_and_pick_numpy(popularity, u)
 
-            self.current_hotspot = chosen_id
-            chosen_hotspot = next(h for h in available_hotspots if h.unique_id == chosen_id)
+        if chosen_idx >= 0:
+            # model.hotspots shares its order with the scoring arrays
+            chosen_hotspot = available_hotspots[chosen_idx]
+            self.current_hotspot = chosen_hotspot.unique_id
 
             # Move to hotspot location if grid exists
-            if hasattr(self.model, 'grid') and hasattr(chosen_hotspot, 'pos'):
-                self.model.grid.move_agent(self, chosen_hotspot.pos)
+            if self._has_grid:
+                self.model.move_tourist(self._t_idx, *chosen_hotspot.pos)
+
+    def _score_and_pick_numpy(self, popularity: np.ndarray, u: float) -> int:
+        """
+        Score every hotspot at once and sample one, mirroring _score_and_pick.
+
+        Args:
+            popularity: Current popularity of each hotspot
+            u: Uniform draw in [0, 1)
+
+        Returns:
+            Index of the chosen hotspot, or -1 if every score is zero
+        """
+        model = self.model
+
+        # Base appeal from LLM-generated persona-hotspot mappings
+        scores = model.appeal_matrix[self._persona_idx].copy()
+
+        # Popularity influence
+        scores += popularity * 0.3
+
+        # Social recommendations
+        scores += self._rec_boost
+
+        # Distance penalty
+        if self.pos is not None:
+            # Square, root and scale in place to avoid per-call temporaries
+            delta = model._hs_pos - self.pos
+            np.multiply(delta, delta, out=delta)
+            distance = delta.sum(axis=1)
+            np.sqrt(distance, out=distance)
+            distance *= 0.05
+            scores -= distance
+
+        # Exploration bonus
+        scores += np.where(self._visited_mask, 0.0, 0.2) * self.exploration_tendency
+
+        np.maximum(scores, 0, out=scores)
+
+        # Probabilistic choice: the draw is searched against the
+        # unnormalized cumulative scores
+        cdf = np.cumsum(scores)
+        if cdf[-1] <= 0:
+            return -1
+        return min(int(np.searchsorted(cdf, u * cdf[-1], side="right")), len(cdf) - 1)
 
     def visit_hotspot(self):
         """Visit the chosen hotspot and calculate satisfaction."""
         if not self.current_hotspot:
             return
 
-        hotspot = next((agent for agent in self.model.agents 
-                       if hasattr(agent, 'unique_id') and agent.unique_id == self.current_hotspot), None)
+        hotspot = self.model.hotspot_by_id.get(self.current_hotspot)
 
         if not hotspot:
             return
 
         # Record visit
-        self.visited_hotspots.append(self.current_hotspot)
+        hotspot_idx = self.model._hs_index[hotspot.unique_id]
+        self.remember_visit(hotspot_idx)
         self.visits_today += 1
         self.total_visits += 1
         hotspot.record_visit()
 
         # Calculate satisfaction based on LLM-generated appeal and capacity
-        base_appeal = hotspot.get_persona_appeal(self.persona_type)
+        base_appeal = float(self.model.appeal_matrix[self._persona_idx, hotspot_idx])
         capacity_factor = hotspot.get_capacity_factor()
 
         self.satisfaction = base_appeal * capacity_factor
         self.satisfaction = max(0, min(1, self.satisfaction))
 
+    def remember_visit(self, hotspot_idx: int):
+        """
+        Record the current hotspot as visited.
+
+        Args:
+            hotspot_idx: Index of the current hotspot in the model's hotspot arrays
+        """
+        self.visited_hotspots.add(self.current_hotspot)
+        self.visit_history.append(self.current_hotspot)
+        self._visited_mask[hotspot_idx] = True
+
     def share_experience(self):
         """Share experience on social media based on satisfaction and persona traits."""
         if not self.current_hotspot:
             return
 
-        if random.random() < self.sharing_probability:
-            hotspot = next((agent for agent in self.model.agents 
-                           if hasattr(agent, 'unique_id') and agent.unique_id == self.current_hotspot), None)
+        if self.model._rand_share[self._t_idx] < self.sharing_probability:
+            hotspot = self.model.hotspot_by_id.get(self.current_hotspot)
 
             if hotspot:
                 # Boost popularity based on satisfaction and social influence
@@ -174,26 +300,24 @@ class Tourist(Agent):
             return
 
         # Find nearby tourists within word-of-mouth range
-        if hasattr(self.model, 'grid'):
-            neighbors = self.model.grid.get_neighbors(self.pos, moore=True, radius=3)
-
-            for neighbor in neighbors:
-                if isinstance(neighbor, Tourist) and neighbor != self:
-                    # Recommendation strength based on persona similarity
-                    if neighbor.persona_type == self.persona_type:
-                        strength = self.influence_on_similar
-                    else:
-                        strength = self.influence_on_different
-
-                    strength *= self.satisfaction
-
-                    # Add recommendation
-                    neighbor.recommendations_received.append({
-                        "hotspot_id": self.current_hotspot,
-                        "strength": strength,
-                        "from_persona": self.persona_type,
-                        "step": self.model.current_step
-                    })
+        if self._has_grid:
+            tourists = self.model.tourists
+            hotspot_idx = self.model._hs_index[self.current_hotspot]
+
+            for i in self.model.tourists_near(self._t_idx, radius=3):
+                neighbor = tourists[i]
+
+                # Recommendation strength based on persona similarity
+                if neighbor.persona_type == self.persona_type:
+                    strength = self.influence_on_similar
+                else:
+                    strength = self.influence_on_different
+
+                strength *= self.satisfaction
+
+                # Add recommendation, weighted by how much the recipient trusts it
+                neighbor._rec_boost[hotspot_idx] += strength * neighbor.recommendation_trust
+                neighbor.recommendations_received += 1
 
     def reset_daily_counters(self):
         """Reset daily activity counters."""
@@ -208,18 +332,14 @@ class ScenarioAwareTourist(Tourist):
     allowing dynamic adaptation to policy changes and external events.
     """
 
+    __slots__ = ("scenario_modifiers",)
+
     def __init__(self, model, persona_data: Dict[str, Any]):
         """Initialize scenario-aware tourist with additional adaptation capabilities."""
         super().__init__(model, persona_data)
 
         # Scenario-related modifiers
-        self.scenario_modifiers = {
-            "satisfaction_modifier": 0.0,
-            "appeal_sensitivity": 1.0, 
-            "cost_sensitivity": 1.0,
-            "crowding_tolerance": 1.0,
-            "sharing_boost": 1.0
-        }
+        self.scenario_modifiers = self.compute_scenario_modifiers(self.persona_type, [], {})
 
     def apply_scenario_effects(self, scenario, current_step: int):
         """
@@ -232,84 +352,104 @@ class ScenarioAwareTourist(Tourist):
         if not scenario:
             return
 
-        # Reset modifiers
-        self.scenario_modifiers = {
-            "satisfaction_modifier": 0.0,
-            "appeal_sensitivity": 1.0,
-            "cost_sensitivity": 1.0,
-            "crowding_tolerance": 1.0,
-            "sharing_boost": 1.0
-        }
+        step_events = [event for event in scenario.events if event["step"] == current_step]
+        self.scenario_modifiers = self.compute_scenario_modifiers(
+            self.persona_type, step_events, scenario.external_factors
+        )
+
+    @classmethod
+    def compute_scenario_modifiers(cls, persona_type: str, step_events: List[Dict[str, Any]],
+                                   external_factors: Dict[str, float]) -> np.ndarray:
+        """
+        Compute the behavior modifiers of a persona for one step.
+
+        The result depends only on the persona type, so the model computes it
+        once per persona and shares it between tourists, who must treat it
+        as read-only.
+
+        Args:
+            persona_type: The tourist persona type
+            step_events: Scenario events firing on this step
+            external_factors: Scenario external factors
+
+        Returns:
+            Array of scenario modifiers indexed by SATISFACTION_MOD, APPEAL_SENS,
+            COST_SENS, CROWDING_TOL and SHARE_BOOST
+        """
+        modifiers = _NEUTRAL_SCENARIO_MODIFIERS.copy()
 
         # Process persona-specific events
-        for event in scenario.events:
-            if (event["step"] == current_step and 
-                event.get("target") == self.persona_type):
-                self._process_persona_event(event)
+        for event in step_events:
+            if event.get("target") == persona_type:
+                cls._process_persona_event(modifiers, event)
 
         # Apply external factors
-        for factor_name, factor_value in scenario.external_factors.items():
-            self._apply_external_factor(factor_name, factor_value)
+        for factor_name, factor_value in external_factors.items():
+            cls._apply_external_factor(modifiers, factor_name, factor_value)
+
+        return modifiers
 
-    def _process_persona_event(self, event: Dict[str, Any]):
+    @staticmethod
+    def _process_persona_event(modifiers: np.ndarray, event: Dict[str, Any]):
         """Process events targeting this persona type."""
         event_type = event["type"]
         params = event["parameters"]
 
         if event_type == "satisfaction_penalty":
             penalty = params.get("penalty", 0.0)
-            self.scenario_modifiers["satisfaction_modifier"] -= penalty
+            modifiers[SATISFACTION_MOD] -= penalty
         elif event_type == "appeal_boost":
             boost = params.get("boost", 0.0)
-            self.scenario_modifiers["appeal_sensitivity"] += boost
+            modifiers[APPEAL_SENS] += boost
 
-    def _apply_external_factor(self, factor_name: str, factor_value: float):
+    @staticmethod
+    def _apply_external_factor(modifiers: np.ndarray, factor_name: str, factor_value: float):
         """Apply external scenario factors to behavior modifiers."""
         factor_mappings = {
-            "cost_sensitivity": "cost_sensitivity",
-            "event_excitement": "satisfaction_modifier",
-            "inconvenience_tolerance": "satisfaction_modifier", 
-            "noise_tolerance": "crowding_tolerance"
+            "cost_sensitivity": COST_SENS,
+            "event_excitement": SATISFACTION_MOD,
+            "inconvenience_tolerance": SATISFACTION_MOD,
+            "noise_tolerance": CROWDING_TOL
         }
 
         if factor_name in factor_mappings:
-            modifier_name = factor_mappings[factor_name]
-            if modifier_name == "satisfaction_modifier":
-                self.scenario_modifiers[modifier_name] += factor_value
+            modifier = factor_mappings[factor_name]
+            if modifier == SATISFACTION_MOD:
+                modifiers[modifier] += factor_value
             else:
-                self.scenario_modifiers[modifier_name] = 1.0 + factor_value
+                modifiers[modifier] = 1.0 + factor_value
 
     def visit_hotspot(self):
         """Enhanced visit with scenario-aware satisfaction calculation."""
         if not self.current_hotspot:
             return
 
-        hotspot = next((agent for agent in self.model.agents 
-                       if hasattr(agent, 'unique_id') and agent.unique_id == self.current_hotspot), None)
+        hotspot = self.model.hotspot_by_id.get(self.current_hotspot)
 
         if not hotspot:
             return
 
         # Record visit
-        self.visited_hotspots.append(self.current_hotspot)
+        hotspot_idx = self.model._hs_index[hotspot.unique_id]
+        self.remember_visit(hotspot_idx)
         self.visits_today += 1
         self.total_visits += 1
         hotspot.record_visit()
 
         # Calculate satisfaction with scenario modifiers
-        base_appeal = hotspot.get_persona_appeal(self.persona_type)
-        base_appeal *= self.scenario_modifiers["appeal_sensitivity"]
+        base_appeal = float(self.model.appeal_matrix[self._persona_idx, hotspot_idx])
+        base_appeal *= self.scenario_modifiers[APPEAL_SENS]
 
         capacity_factor = hotspot.get_capacity_factor()
         # Apply crowding tolerance modifier
-        capacity_factor = (capacity_factor - 1.0) * self.scenario_modifiers["crowding_tolerance"] + 1.0
+        capacity_factor = (capacity_factor - 1.0) * self.scenario_modifiers[CROWDING_TOL] + 1.0
 
         # Apply scenario-specific modifiers
         scenario_satisfaction = hotspot.get_scenario_satisfaction_modifier(self.persona_type)
 
-        self.satisfaction = (base_appeal * capacity_factor + 
-                           scenario_satisfaction + 
-                           self.scenario_modifiers["satisfaction_modifier"])
+        self.satisfaction = float(base_appeal * capacity_factor + 
+                                  scenario_satisfaction + 
+                                  self.scenario_modifiers[SATISFACTION_MOD])
         self.satisfaction = max(0, min(1, self.satisfaction))
 
     def share_experience(self):
@@ -317,11 +457,10 @@ class ScenarioAwareTourist(Tourist):
         if not self.current_hotspot:
             return
 
-        modified_sharing_prob = self.sharing_probability * self.scenario_modifiers["sharing_boost"]
+        modified_sharing_prob = self.sharing_probability * self.scenario_modifiers[SHARE_BOOST]
 
-        if random.random() < modified_sharing_prob:
-            hotspot = next((agent for agent in self.model.agents 
-                           if hasattr(agent, 'unique_id') and agent.unique_id == self.current_hotspot), None)
+        if self.model._rand_share[self._t_idx] < modified_sharing_prob:
+            hotspot = self.model.hotspot_by_id.get(self.current_hotspot)
 
             if hotspot:
                 boost = self.satisfaction * self.social_influence * 0.1
@@ -5,12 +5,13 @@ Simulation Models
 Core simulation model classes.
 """
 
-from .tourism_model import TourismModel, ScenarioAwareTourismModel
+from .tourism_model import TourismModel, ScenarioAwareTourismModel, run_batch
 from .scenario_manager import ScenarioManager, TourismScenario
 
 __all__ = [
     'TourismModel',
     'ScenarioAwareTourismModel', 
+    'run_batch',
     'ScenarioManager',
     'TourismScenario'
 ]
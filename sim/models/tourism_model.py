@@ -6,20 +6,40 @@ This module defines the main simulation model classes that orchestrate
 the tourism simulation, manage agent interactions, and handle data collection.
 """
 
+import sys
 import random
+import multiprocessing
+from collections import defaultdict
 import numpy as np
 import pandas as pd
 from mesa import Model
 from mesa.space import MultiGrid
-from mesa.model import AgentSet
 from mesa.datacollection import DataCollector
 from typing import Dict, List, Optional, Any, Tuple
 
-from ..agents.tourist import Tourist, ScenarioAwareTourist
+# scipy is optional; without it neighbor queries scan the position array
+try:
+    from scipy.spatial import cKDTree
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+from ..agents.tourist import (
+    Tourist, ScenarioAwareTourist, SATISFACTION_MOD, APPEAL_SENS, CROWDING_TOL, SHARE_BOOST
+)
 from ..agents.hotspot import Hotspot, ScenarioAwareHotspot
 from .scenario_manager import TourismScenario
 
 
+def _copy_report(value: Any) -> Any:
+    """Copy the dict/list structure of a cached report; leaf values are scalars."""
+    if isinstance(value, dict):
+        return {key: _copy_report(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_report(item) for item in value]
+    return value
+
+
 class TourismModel(Model):
     """
     Base tourism simulation model with LLM-generated agents.
@@ -29,6 +49,11 @@ class TourismModel(Model):
     through agent interactions and social influence networks.
     """
 
+    # Agent classes instantiated by _create_tourists/_create_hotspots;
+    # subclasses override these instead of re-implementing agent creation.
+    tourist_class = Tourist
+    hotspot_class = Hotspot
+
     def __init__(self, 
                  personas_data: List[Dict] = None,
                  hotspots_data: List[Dict] = None, 
@@ -36,7 +61,8 @@ class TourismModel(Model):
                  num_tourists: int = 50,
                  grid_width: int = 20,
                  grid_height: int = 20,
-                 random_seed: int = None):
+                 random_seed: int = None,
+                 batched_stepping: bool = False):
         """
         Initialize the tourism simulation model.
 
@@ -48,6 +74,8 @@ class TourismModel(Model):
             grid_width: Width of the spatial grid
             grid_height: Height of the spatial grid
             random_seed: Random seed for reproducibility
+            batched_stepping: Step tourists phase by phase over arrays
+                (see step_tourists_batched) instead of one agent at a time
         """
         super().__init__()
 
@@ -62,15 +90,25 @@ class TourismModel(Model):
         self.business_rules = business_rules or {}
         self.num_tourists = num_tourists
 
+        # Row of each persona type in appeal_matrix
+        persona_types = dict.fromkeys(persona["type"] for persona in self.personas_data)
+        self.persona_index = {persona_type: i for i, persona_type in enumerate(persona_types)}
+
         # Initialize model components
         self.grid = MultiGrid(grid_width, grid_height, torus=False)
         self.running = True
         self.current_step = 0
+        self.batched_stepping = batched_stepping
 
-        # Agent collections
+        # Agent collections (Mesa registers every agent in self.agents on creation).
+        # Tourist and Hotspot declare __slots__, so agents only carry the
+        # attributes set in their own __init__ - never attach new ones from here.
         self.tourists = []
         self.hotspots = []
-        self.agent_set = AgentSet([], random=self.random)
+        self.hotspot_by_id = {}
+
+        # Reports computed during the current step, cleared whenever state advances
+        self._report_cache = {}
 
         # Data collection
         self._setup_data_collection()
@@ -81,22 +119,37 @@ class TourismModel(Model):
 
     def _setup_data_collection(self):
         """Set up comprehensive data collection for analysis."""
+        # np.fromiter fills each array straight from the agents without
+        # building an intermediate Python list first
         model_reporters = {
-            "Average_Popularity": lambda m: np.mean([h.current_popularity for h in m.hotspots]) if m.hotspots else 0,
-            "Total_Visitors": lambda m: sum([h.total_visitors + h.visitors_today for h in m.hotspots]),
-            "Social_Shares": lambda m: sum([h.social_shares for h in m.hotspots]),
-            "Average_Satisfaction": lambda m: np.mean([t.satisfaction for t in m.tourists]) if m.tourists else 0,
-            "Active_Tourists": lambda m: len([t for t in m.tourists if t.visits_today < t.daily_visits]),
-            "Hotspot_Visits_Today": lambda m: sum([h.visitors_today for h in m.hotspots])
+            "Average_Popularity": lambda m: np.fromiter(
+                (h.current_popularity for h in m.hotspots), dtype=np.float64, count=len(m.hotspots)
+            ).mean() if m.hotspots else 0,
+            "Total_Visitors": lambda m: int(np.add(
+                np.fromiter((h.total_visitors for h in m.hotspots), dtype=np.int64, count=len(m.hotspots)),
+                np.fromiter((h.visitors_today for h in m.hotspots), dtype=np.int64, count=len(m.hotspots))
+            ).sum()),
+            "Social_Shares": lambda m: int(np.fromiter(
+                (h.social_shares for h in m.hotspots), dtype=np.int64, count=len(m.hotspots)
+            ).sum()),
+            "Average_Satisfaction": lambda m: np.fromiter(
+                (t.satisfaction for t in m.tourists), dtype=np.float64, count=len(m.tourists)
+            ).mean() if m.tourists else 0,
+            "Active_Tourists": lambda m: sum(1 for t in m.tourists if t.visits_today < t.daily_visits),
+            "Hotspot_Visits_Today": lambda m: int(np.fromiter(
+                (h.visitors_today for h in m.hotspots), dtype=np.int64, count=len(m.hotspots)
+            ).sum())
         }
 
+        # Attribute-name reporters resolve to getattr(agent, name, None) inside
+        # Mesa, so agents lacking an attribute still report None.
         agent_reporters = {
             "Agent_Type": lambda a: type(a).__name__,
-            "Popularity": lambda a: getattr(a, 'current_popularity', None),
-            "Visitors_Today": lambda a: getattr(a, 'visitors_today', None),
-            "Satisfaction": lambda a: getattr(a, 'satisfaction', None),
-            "Persona_Type": lambda a: getattr(a, 'persona_type', None),
-            "Visits_Today": lambda a: getattr(a, 'visits_today', None)
+            "Popularity": "current_popularity",
+            "Visitors_Today": "visitors_today",
+            "Satisfaction": "satisfaction",
+            "Persona_Type": "persona_type",
+            "Visits_Today": "visits_today"
         }
 
         self.datacollector = DataCollector(
@@ -107,9 +160,9 @@ class TourismModel(Model):
     def _create_hotspots(self):
         """Create hotspot agents from LLM-generated data."""
         for hotspot_data in self.hotspots_data:
-            hotspot = Hotspot(self, hotspot_data)
+            hotspot = self.hotspot_class(self, hotspot_data)
             self.hotspots.append(hotspot)
-            self.agent_set.add(hotspot)
+            self.hotspot_by_id[hotspot.unique_id] = hotspot
 
             # Place hotspot on grid
             location = hotspot_data.get("location", {})
@@ -122,32 +175,254 @@ class TourismModel(Model):
 
             self.grid.place_agent(hotspot, (x, y))
 
+        self._rebuild_hotspot_arrays()
+
+    def _rebuild_hotspot_arrays(self):
+        """
+        Rebuild the per-hotspot arrays tourists score destinations against.
+
+        Rows follow the order of self.hotspots. Must be called again whenever
+        hotspots are added or removed or their persona appeal changes.
+        """
+        self._hs_ids = np.fromiter(
+            (h.unique_id for h in self.hotspots), dtype=np.int64, count=len(self.hotspots)
+        )
+        self._hs_index = {hotspot_id: i for i, hotspot_id in enumerate(self._hs_ids.tolist())}
+        self._hs_pos = np.array([h.pos for h in self.hotspots], dtype=np.float64).reshape(-1, 2)
+
+        # (persona, hotspot) appeal, so each tourist reads one contiguous row
+        self.appeal_matrix = np.array(
+            [[h.get_persona_appeal(persona_type) for h in self.hotspots]
+             for persona_type in self.persona_index],
+            dtype=np.float64
+        ).reshape(len(self.persona_index), len(self.hotspots))
+
     def _create_tourists(self):
         """Create tourist agents from LLM-generated persona data."""
         if not self.personas_data:
             raise ValueError("No persona data provided for tourist creation")
 
+        # Randomly select personas in one draw (could be weighted via np.random.choice(p=...))
+        persona_indices = np.random.randint(0, len(self.personas_data), size=self.num_tourists)
+
+        # Tourist positions mirrored as rows indexed by tourist._t_idx, kept in
+        # sync with the grid by move_tourist
+        self._tourist_xy = np.empty((self.num_tourists, 2), dtype=np.int32)
+
+        # KD-tree over _tourist_xy, only set while positions are frozen
+        self._tourist_tree = None
+
         for i in range(self.num_tourists):
-            # Randomly select persona (could be weighted based on configuration)
-            persona_data = random.choice(self.personas_data)
-            tourist = Tourist(self, persona_data)
+            persona_data = self.personas_data[persona_indices[i]]
+            tourist = self.tourist_class(self, persona_data)
             self.tourists.append(tourist)
-            self.agent_set.add(tourist)
 
             # Place tourist randomly on grid
             x = random.randrange(self.grid.width)
             y = random.randrange(self.grid.height)
+            self._tourist_xy[i] = (x, y)
             self.grid.place_agent(tourist, (x, y))
 
+        self._draw_step_randoms()
+
+    def _draw_step_randoms(self):
+        """
+        Draw the uniform numbers tourists consume during the next step.
+
+        One vectorized draw replaces a Python-level RNG call per tourist;
+        each tourist reads its own entry at _t_idx.
+        """
+        self._rand_share = np.random.random(len(self.tourists))
+
+    def move_tourist(self, i: int, x: int, y: int):
+        """
+        Move a tourist on the grid and update its row in the position array.
+
+        Args:
+            i: Index of the tourist in self.tourists
+            x: Target x coordinate
+            y: Target y coordinate
+        """
+        self.grid.move_agent(self.tourists[i], (x, y))
+        self._tourist_xy[i] = (x, y)
+
+    def tourists_near(self, i: int, radius: int = 1) -> np.ndarray:
+        """
+        Find tourists in the Moore neighborhood of a tourist.
+
+        Matches grid.get_neighbors(moore=True) restricted to tourists: the
+        tourist's own cell is excluded, along with everyone sharing it.
+
+        Args:
+            i: Index of the tourist in self.tourists
+            radius: Neighborhood radius in cells
+
+        Returns:
+            Indices into self.tourists
+        """
+        if self._tourist_tree is not None:
+            candidates = np.asarray(
+                self._tourist_tree.query_ball_point(self._tourist_xy[i], r=radius, p=np.inf),
+                dtype=np.int64
+            )
+            same_cell = (self._tourist_xy[candidates] == self._tourist_xy[i]).all(axis=1)
+            return candidates[~same_cell]
+
+        reach = np.abs(self._tourist_xy - self._tourist_xy[i]).max(axis=1)
+        return np.flatnonzero((reach <= radius) & (reach > 0))
+
+    def tourist_density(self) -> np.ndarray:
+        """
+        Count tourists per grid cell.
+
+        Returns:
+            Integer array of shape (grid width, grid height)
+        """
+        cells = self._tourist_xy[:, 0] * self.grid.height + self._tourist_xy[:, 1]
+        return np.bincount(
+            cells, minlength=self.grid.width * self.grid.height
+        ).reshape(self.grid.width, self.grid.height)
+
     def step(self):
         """Execute one step of the simulation."""
         self.datacollector.collect(self)
+        self._report_cache.clear()
 
-        # Step all agents
-        self.agent_set.do("step")
+        self._step_agents()
 
         self.current_step += 1
 
+    def _step_agents(self):
+        """Step all agents, hotspots before tourists."""
+        if self.batched_stepping:
+            for hotspot in self.hotspots:
+                hotspot.step()
+            self.step_tourists_batched()
+        else:
+            self.agents.do("step")
+
+        self._draw_step_randoms()
+
+    def step_tourists_batched(self):
+        """
+        Step all active tourists together, one behavior phase at a time.
+
+        Every tourist chooses a hotspot from a single (tourist, hotspot) score
+        matrix, then all visits, shares and recommendations are applied. Unlike
+        stepping agents one by one, choices within a step see the popularity
+        and recommendations from the start of the step, and satisfaction uses
+        the crowding after all of the step's visits.
+        """
+        tourists = [t for t in self.tourists if t.visits_today < t.daily_visits]
+        if not tourists or not self.hotspots:
+            return
+
+        n, n_hotspots = len(tourists), len(self.hotspots)
+        t_idx = np.fromiter((t._t_idx for t in tourists), dtype=np.int64, count=n)
+        persona_idx = np.fromiter((t._persona_idx for t in tourists), dtype=np.int64, count=n)
+
+        # Choose: score every (tourist, hotspot) pair at once
+        scores = self.appeal_matrix[persona_idx]
+        scores += np.fromiter(
+            (h.current_popularity for h in self.hotspots), dtype=np.float64, count=n_hotspots
+        ) * 0.3
+        scores += np.stack([t._rec_boost for t in tourists])
+
+        delta = self._tourist_xy[t_idx, None, :] - self._hs_pos[None, :, :]
+        np.multiply(delta, delta, out=delta)
+        distance = delta.sum(axis=2)
+        np.sqrt(distance, out=distance)
+        distance *= 0.05
+        scores -= distance
+
+        visited = np.stack([t._visited_mask for t in tourists])
+        exploration = np.fromiter((t.exploration_tendency for t in tourists), dtype=np.float64, count=n)
+        scores += np.where(visited, 0.0, 0.2) * exploration[:, None]
+        np.maximum(scores, 0, out=scores)
+
+        # One uniform draw per tourist against its row of cumulative scores;
+        # tourists with nothing to choose stay at their previous hotspot
+        cdf = np.cumsum(scores, axis=1)
+        totals = cdf[:, -1]
+        r = np.random.random(n) * totals
+        sampled = np.minimum((cdf <= r[:, None]).sum(axis=1), n_hotspots - 1)
+        previous = np.fromiter(
+            (self._hs_index.get(t.current_hotspot, -1) for t in tourists), dtype=np.int64, count=n
+        )
+        moved = totals > 0
+        chosen = np.where(moved, sampled, previous)
+        visiting = chosen >= 0
+
+        # Visit
+        for tourist, i, has_moved in zip(tourists, chosen.tolist(), moved.tolist()):
+            if has_moved:
+                hotspot = self.hotspots[i]
+                tourist.current_hotspot = hotspot.unique_id
+                self.move_tourist(tourist._t_idx, *hotspot.pos)
+            if i >= 0:
+                tourist.remember_visit(i)
+                tourist.visits_today += 1
+                tourist.total_visits += 1
+
+        visits = np.bincount(chosen[visiting], minlength=n_hotspots)
+        for hotspot, count in zip(self.hotspots, visits.tolist()):
+            if count:
+                hotspot.visitors_today += count
+                hotspot.total_visitors += count
+
+        satisfaction = np.clip(self._batched_satisfaction(tourists, persona_idx, chosen), 0, 1)
+        for tourist, value, visited in zip(tourists, satisfaction.tolist(), visiting.tolist()):
+            if visited:
+                tourist.satisfaction = value
+
+        # Share: popularity is capped at 1.0 after summing the step's boosts
+        sharers = visiting & (self._rand_share[t_idx] < self._batched_sharing_probability(tourists))
+        social_influence = np.fromiter((t.social_influence for t in tourists), dtype=np.float64, count=n)
+        boosts = np.bincount(
+            chosen[sharers], weights=satisfaction[sharers] * social_influence[sharers] * 0.1,
+            minlength=n_hotspots
+        )
+        shares = np.bincount(chosen[sharers], minlength=n_hotspots)
+        for hotspot, boost, count in zip(self.hotspots, boosts.tolist(), shares.tolist()):
+            if count:
+                hotspot.current_popularity = min(1.0, hotspot.current_popularity + boost)
+                hotspot.social_shares += count
+
+        # Recommend: nobody moves during this phase, so a single KD-tree over
+        # the final positions serves every neighbor query
+        if SCIPY_AVAILABLE:
+            self._tourist_tree = cKDTree(self._tourist_xy)
+        try:
+            for tourist in tourists:
+                tourist.make_recommendations()
+        finally:
+            self._tourist_tree = None
+
+    def _batched_satisfaction(self, tourists: List[Tourist], persona_idx: np.ndarray,
+                              chosen: np.ndarray) -> np.ndarray:
+        """
+        Satisfaction of each tourist with its chosen hotspot for batched steps.
+
+        Args:
+            tourists: Active tourists
+            persona_idx: Appeal matrix row of each tourist
+            chosen: Hotspot index of each tourist, -1 where none was visited
+
+        Returns:
+            Unclipped satisfaction per tourist
+        """
+        capacity_factor = np.fromiter(
+            (h.get_capacity_factor() for h in self.hotspots), dtype=np.float64, count=len(self.hotspots)
+        )
+        chosen = np.maximum(chosen, 0)
+        return self.appeal_matrix[persona_idx, chosen] * capacity_factor[chosen]
+
+    def _batched_sharing_probability(self, tourists: List[Tourist]) -> np.ndarray:
+        """Sharing probability of each tourist for batched steps."""
+        return np.fromiter(
+            (t.sharing_probability for t in tourists), dtype=np.float64, count=len(tourists)
+        )
+
     def run_simulation(self, steps: int = 20) -> pd.DataFrame:
         """
         Run the simulation for specified number of steps.
@@ -172,11 +447,49 @@ class TourismModel(Model):
         return self.datacollector.get_agent_vars_dataframe()
 
     def get_hotspot_statistics(self) -> List[Dict[str, Any]]:
-        """Get comprehensive statistics for all hotspots."""
-        return [hotspot.get_statistics() for hotspot in self.hotspots]
+        """Get comprehensive statistics for all hotspots (cached per step, returned as a copy)."""
+        cached = self._report_cache.get("hotspot_statistics")
+        if cached is None:
+            cached = self._build_hotspot_frame().to_dict(orient="records") if self.hotspots else []
+            self._report_cache["hotspot_statistics"] = cached
+        return _copy_report(cached)
+
+    def _build_hotspot_frame(self) -> pd.DataFrame:
+        """
+        Build a column-oriented frame of hotspot state.
+
+        Mirrors Hotspot.get_statistics() but computes derived and rounded
+        columns with vectorized operations instead of one dict per hotspot.
+
+        Returns:
+            DataFrame with one row per hotspot
+        """
+        hotspots = self.hotspots
+        frame = pd.DataFrame({
+            "name": [h.name for h in hotspots],
+            "category": [h.category for h in hotspots],
+            "current_popularity": [h.current_popularity for h in hotspots],
+            "visitors_today": [h.visitors_today for h in hotspots],
+            "total_visitors": [h.total_visitors for h in hotspots],
+            "social_shares": [h.social_shares for h in hotspots],
+            "capacity": [h.capacity for h in hotspots]
+        })
+
+        # All hotspots step together, so their histories share one length
+        history = np.array([h.popularity_history for h in hotspots], dtype=np.float64)
+
+        frame["current_popularity"] = frame["current_popularity"].round(3)
+        frame["capacity_utilization"] = (frame["visitors_today"] / frame["capacity"].clip(lower=1)).round(3)
+        frame["avg_popularity"] = history.mean(axis=1).round(3)
+
+        return frame
 
     def get_persona_statistics(self) -> Dict[str, Dict[str, Any]]:
-        """Get statistics grouped by tourist persona type."""
+        """Get statistics grouped by tourist persona type (cached per step, returned as a copy)."""
+        cached = self._report_cache.get("persona_statistics")
+        if cached is not None:
+            return _copy_report(cached)
+
         persona_stats = {}
 
         for tourist in self.tourists:
@@ -193,7 +506,7 @@ class TourismModel(Model):
             stats["count"] += 1
             stats["total_satisfaction"] += tourist.satisfaction
             stats["total_visits"] += tourist.total_visits
-            stats["total_recommendations"] += len(tourist.recommendations_received)
+            stats["total_recommendations"] += tourist.recommendations_received
 
         # Calculate averages
         for persona, stats in persona_stats.items():
@@ -203,18 +516,29 @@ class TourismModel(Model):
                 stats["avg_visits"] = stats["total_visits"] / count
                 stats["avg_recommendations"] = stats["total_recommendations"] / count
 
-        return persona_stats
+        self._report_cache["persona_statistics"] = persona_stats
+        return _copy_report(persona_stats)
 
     def get_summary_report(self) -> Dict[str, Any]:
-        """Generate a comprehensive summary report of simulation results."""
+        """
+        Generate a comprehensive summary report of simulation results.
+
+        The report is cached until the next step; every call returns its own
+        copy, so callers may modify the result freely.
+        """
+        cached = self._report_cache.get("summary_report")
+        if cached is not None:
+            return _copy_report(cached)
+
         model_data = self.get_model_data()
 
         if model_data.empty:
             return {"error": "No simulation data available"}
 
-        final_metrics = model_data.iloc[-1] if len(model_data) > 0 else {}
+        # Convert the final row once so the lookups below are plain dict gets
+        final_metrics = model_data.iloc[-1].to_dict()
 
-        return {
+        summary = {
             "simulation_steps": len(model_data),
             "final_metrics": {
                 "average_popularity": final_metrics.get("Average_Popularity", 0),
@@ -231,6 +555,9 @@ class TourismModel(Model):
             }
         }
 
+        self._report_cache["summary_report"] = summary
+        return _copy_report(summary)
+
 
 class ScenarioAwareTourismModel(TourismModel):
     """
@@ -240,6 +567,9 @@ class ScenarioAwareTourismModel(TourismModel):
     including policy changes, events, and external factors that affect tourism dynamics.
     """
 
+    tourist_class = ScenarioAwareTourist
+    hotspot_class = ScenarioAwareHotspot
+
     def __init__(self, 
                  scenario: Optional[TourismScenario] = None,
                  personas_data: List[Dict] = None,
@@ -248,7 +578,8 @@ class ScenarioAwareTourismModel(TourismModel):
                  num_tourists: int = 50,
                  grid_width: int = 20,
                  grid_height: int = 20,
-                 random_seed: int = None):
+                 random_seed: int = None,
+                 batched_stepping: bool = False):
         """
         Initialize scenario-aware tourism model.
 
@@ -258,55 +589,91 @@ class ScenarioAwareTourismModel(TourismModel):
         """
         self.current_scenario = scenario
         super().__init__(personas_data, hotspots_data, business_rules, 
-                        num_tourists, grid_width, grid_height, random_seed)
+                        num_tourists, grid_width, grid_height, random_seed,
+                        batched_stepping)
 
-    def _create_tourists(self):
-        """Create scenario-aware tourist agents."""
-        if not self.personas_data:
-            raise ValueError("No persona data provided for tourist creation")
+        self._index_scenario(scenario)
 
-        self.tourists = []
-        for i in range(self.num_tourists):
-            persona_data = random.choice(self.personas_data)
-            tourist = ScenarioAwareTourist(self, persona_data)
-            self.tourists.append(tourist)
+    def _index_scenario(self, scenario: Optional[TourismScenario]):
+        """
+        Precompute the step -> events index used to skip idle scenario steps.
 
-            # Place tourist randomly on grid
-            x = random.randrange(self.grid.width)
-            y = random.randrange(self.grid.height)
-            self.grid.place_agent(tourist, (x, y))
+        Args:
+            scenario: TourismScenario instance or None
+        """
+        self._pending_modifier_reset = False
 
-    def _create_hotspots(self):
-        """Create scenario-aware hotspot agents."""
-        self.hotspots = []
-        for hotspot_data in self.hotspots_data:
-            hotspot = ScenarioAwareHotspot(self, hotspot_data)
-            self.hotspots.append(hotspot)
+        # Agents that react to scenarios, in creation order
+        self._scenario_hotspots = [hotspot for hotspot in self.hotspots
+                                   if hasattr(hotspot, 'apply_scenario_effects')]
+        self._scenario_tourists = [tourist for tourist in self.tourists
+                                   if hasattr(tourist, 'compute_scenario_modifiers')]
 
-            # Place hotspot on grid
-            location = hotspot_data.get("location", {})
-            x = location.get("x", random.randrange(self.grid.width))
-            y = location.get("y", random.randrange(self.grid.height))
+        self._index_scenario_events(scenario)
 
-            # Ensure coordinates are within grid bounds
-            x = max(0, min(x, self.grid.width - 1))
-            y = max(0, min(y, self.grid.height - 1))
+    @staticmethod
+    def _scenario_signature(scenario: Optional[TourismScenario]) -> Tuple:
+        """Identity and content sizes of a scenario, to detect changes after indexing."""
+        if not scenario:
+            return (None,)
+        return (id(scenario), len(scenario.events), len(scenario.regulations), len(scenario.external_factors))
 
-            self.grid.place_agent(hotspot, (x, y))
+    def _index_scenario_events(self, scenario: Optional[TourismScenario]):
+        """
+        Build the step -> events index and the regulations/factors flag.
+
+        step() rebuilds the index whenever the scenario is replaced or gains or
+        loses events, regulations or factors; events edited in place (same
+        count) only take effect after set_scenario().
+
+        Args:
+            scenario: TourismScenario instance or None
+        """
+        self._events_by_step = defaultdict(list)
+        self._has_regs_or_factors = False
+        self._indexed_signature = self._scenario_signature(scenario)
+
+        if scenario:
+            for event in scenario.events:
+                self._events_by_step[event["step"]].append(event)
+            self._has_regs_or_factors = bool(scenario.regulations or scenario.external_factors)
 
     def step(self):
         """Execute one step with scenario processing."""
         self.datacollector.collect(self)
+        self._report_cache.clear()
 
-        # Apply scenario effects before agent steps
-        if self.current_scenario:
-            for agent in self.agents:
-                if hasattr(agent, 'apply_scenario_effects'):
-                    agent.apply_scenario_effects(self.current_scenario, self.current_step)
+        # Apply scenario effects before agent steps. Agents only need to be
+        # visited when an event fires, when regulations/factors are active, or
+        # on the step after an event so tourists can reset their modifiers.
+        if self._scenario_signature(self.current_scenario) != self._indexed_signature:
+            # The scenario was replaced or modified after it was indexed; agents
+            # may still hold its modifiers, so dispatch once more to reset them
+            self._index_scenario_events(self.current_scenario)
+            self._pending_modifier_reset = True
 
-        # Step all agents
-        for agent in self.agents:
-            agent.step()
+        if self.current_scenario:
+            step_events = self._events_by_step.get(self.current_step)
+            if step_events or self._has_regs_or_factors or self._pending_modifier_reset:
+                for hotspot in self._scenario_hotspots:
+                    hotspot.apply_scenario_effects(self.current_scenario, self.current_step)
+
+                # Tourist modifiers depend only on persona type, so compute
+                # one table per step and hand each tourist its row
+                if self._scenario_tourists:
+                    modifier_table = {
+                        persona_type: self.tourist_class.compute_scenario_modifiers(
+                            persona_type, step_events or [], self.current_scenario.external_factors
+                        )
+                        for persona_type in self.persona_index
+                    }
+                    for tourist in self._scenario_tourists:
+                        tourist.scenario_modifiers = modifier_table[tourist.persona_type]
+                # Events and regulations may have changed hotspot appeal
+                self._rebuild_hotspot_arrays()
+            self._pending_modifier_reset = bool(step_events)
+
+        self._step_agents()
 
         self.current_step += 1
 
@@ -318,6 +685,46 @@ class ScenarioAwareTourismModel(TourismModel):
             scenario: TourismScenario instance or None to clear
         """
         self.current_scenario = scenario
+        self._index_scenario(scenario)
+        # Agents may still hold the previous scenario's modifiers
+        self._pending_modifier_reset = True
+        self._report_cache.clear()
+
+    def _batched_satisfaction(self, tourists: List[Tourist], persona_idx: np.ndarray,
+                              chosen: np.ndarray) -> np.ndarray:
+        """Batched satisfaction including tourist and hotspot scenario modifiers."""
+        capacity_factor = np.fromiter(
+            (h.get_capacity_factor() for h in self.hotspots), dtype=np.float64, count=len(self.hotspots)
+        )
+        chosen = np.maximum(chosen, 0)
+        modifiers = np.stack([t.scenario_modifiers for t in tourists])
+        scenario_satisfaction = np.fromiter(
+            (self.hotspots[i].get_scenario_satisfaction_modifier(t.persona_type)
+             for t, i in zip(tourists, chosen.tolist())),
+            dtype=np.float64, count=len(tourists)
+        )
+
+        base_appeal = self.appeal_matrix[persona_idx, chosen] * modifiers[:, APPEAL_SENS]
+        crowding = (capacity_factor[chosen] - 1.0) * modifiers[:, CROWDING_TOL] + 1.0
+        return base_appeal * crowding + scenario_satisfaction + modifiers[:, SATISFACTION_MOD]
+
+    def _batched_sharing_probability(self, tourists: List[Tourist]) -> np.ndarray:
+        """Batched sharing probability scaled by each tourist's sharing boost."""
+        sharing_probability = super()._batched_sharing_probability(tourists)
+        sharing_probability *= np.stack([t.scenario_modifiers for t in tourists])[:, SHARE_BOOST]
+        return sharing_probability
+
+    def _build_hotspot_frame(self) -> pd.DataFrame:
+        """Build the hotspot frame including scenario effect columns."""
+        frame = super()._build_hotspot_frame()
+        hotspots = self.hotspots
+
+        frame["effective_capacity"] = [h.effective_capacity for h in hotspots]
+        frame["accessibility_modifier"] = np.round([h.accessibility_modifier for h in hotspots], 3)
+        frame["active_events"] = [len(h.active_events) for h in hotspots]
+        frame["processed_events"] = [len(h.processed_events) for h in hotspots]
+
+        return frame
 
     def get_scenario_impact_summary(self) -> Dict[str, Any]:
         """Generate summary of scenario impacts on the simulation."""
@@ -365,17 +772,23 @@ class ScenarioAwareTourismModel(TourismModel):
         baseline_metrics = baseline_results["final_metrics"]
         current_metrics = current_results["final_metrics"]
 
-        comparison = {}
-        for metric, current_value in current_metrics.items():
-            baseline_value = baseline_metrics.get(metric, 0)
+        metrics = list(current_metrics.keys())
+        baseline_values = [baseline_metrics.get(metric, 0) for metric in metrics]
+        current_values = [current_metrics[metric] for metric in metrics]
+
+        baseline = np.array(baseline_values, dtype=np.float64)
+        current = np.array(current_values, dtype=np.float64)
 
-            if baseline_value != 0:
-                change = current_value - baseline_value
-                percent_change = (change / baseline_value) * 100
-            else:
-                change = current_value
-                percent_change = 0 if current_value == 0 else 100
+        # A zero baseline reports the full current value as the change
+        changes = current - baseline
+        with np.errstate(divide="ignore", invalid="ignore"):
+            percent_changes = np.where(baseline != 0, changes / baseline * 100.0,
+                                       np.where(current == 0, 0.0, 100.0))
 
+        comparison = {}
+        for metric, baseline_value, current_value, change, percent_change in zip(
+                metrics, baseline_values, current_values,
+                changes.tolist(), percent_changes.tolist()):
             comparison[metric] = {
                 "baseline": baseline_value,
                 "scenario": current_value,
@@ -388,3 +801,85 @@ class ScenarioAwareTourismModel(TourismModel):
             "metrics_comparison": comparison,
             "scenario_summary": self.get_scenario_impact_summary()
         }
+
+
+def _run_one(run_kwargs: Dict[str, Any]) -> pd.DataFrame:
+    """Build one model from plain keyword arguments and run it (batch worker)."""
+    run_kwargs = dict(run_kwargs)
+    model_class = run_kwargs.pop("model_class")
+    steps = run_kwargs.pop("steps")
+
+    model = model_class(**run_kwargs)
+    return model.run_simulation(steps)
+
+
+def _batch_context():
+    """
+    Multiprocessing context for run_batch workers.
+
+    Importing Mesa forces the global default start method to "spawn", so the
+    context is chosen explicitly: fork on Linux, where workers inherit the
+    loaded modules, and spawn elsewhere (fork is unsafe on macOS).
+    """
+    if sys.platform.startswith("linux"):
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context("spawn")
+
+
+def run_batch(personas_data: List[Dict],
+              hotspots_data: List[Dict],
+              business_rules: Dict = None,
+              n_runs: int = 4,
+              steps: int = 20,
+              num_tourists: int = 50,
+              seeds: Optional[List[int]] = None,
+              processes: Optional[int] = None,
+              model_class: type = TourismModel,
+              **model_kwargs) -> List[pd.DataFrame]:
+    """
+    Run independent simulations for several random seeds in parallel.
+
+    Each worker process constructs its own model from plain configuration
+    data, so no Mesa objects are pickled across process boundaries.
+
+    Workers are forked on Linux. Other platforms spawn them, which re-imports
+    the calling script in every worker, so scripts there must call run_batch
+    from inside an ``if __name__ == "__main__":`` guard (or pass processes=1).
+
+    Args:
+        personas_data: List of LLM-generated persona dictionaries
+        hotspots_data: List of LLM-generated hotspot dictionaries
+        business_rules: LLM-generated business rules dictionary
+        n_runs: Number of simulations to run
+        steps: Number of steps for each simulation
+        num_tourists: Number of tourist agents per simulation
+        seeds: Random seeds, one per run (defaults to 0..n_runs-1)
+        processes: Worker process count (None uses all cores, 1 runs serially)
+        model_class: Model class to instantiate, e.g. ScenarioAwareTourismModel
+        **model_kwargs: Extra model arguments (grid_width, scenario, ...)
+
+    Returns:
+        List of model data DataFrames, in the same order as the seeds
+    """
+    if seeds is None:
+        seeds = list(range(n_runs))
+    elif len(seeds) != n_runs:
+        raise ValueError(f"Expected {n_runs} seeds, got {len(seeds)}")
+
+    runs = [
+        dict(model_kwargs,
+             model_class=model_class,
+             steps=steps,
+             personas_data=personas_data,
+             hotspots_data=hotspots_data,
+             business_rules=business_rules,
+             num_tourists=num_tourists,
+             random_seed=seed)
+        for seed in seeds
+    ]
+
+    if processes == 1:
+        return [_run_one(run) for run in runs]
+
+    with _batch_context().Pool(processes) as pool:
+        return pool.map(_run_one, runs)
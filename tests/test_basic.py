@@ -12,6 +12,8 @@ import os
 import unittest
 import tempfile
 import json
+from types import SimpleNamespace
+from unittest import mock
 
 # Add package to path for testing
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -26,12 +28,20 @@ except ImportError as e:
 
 try:
     # Import heavy modules (may fail without numpy)
-    from sim import TourismModel, ScenarioAwareTourismModel, TourismScenario, ScenarioManager
+    import numpy as np
+    import pandas as pd
+    from sim import TourismModel, ScenarioAwareTourismModel, TourismScenario, ScenarioManager, run_batch
     from utils import analyze_simulation_results
+    from utils.analysis import analyze_hotspots, analyze_trends
+    from utils import analysis as analysis_module
+    from sim.agents import tourist as tourist_module
+    from utils import quick_visualize
     HEAVY_IMPORTS_AVAILABLE = True
+    NUMBA_AVAILABLE = analysis_module.NUMBA_AVAILABLE
 except ImportError as e:
     print(f"Warning: Heavy imports failed: {e}")
     HEAVY_IMPORTS_AVAILABLE = False
+    NUMBA_AVAILABLE = False
 
 IMPORTS_AVAILABLE = VALIDATION_AVAILABLE or HEAVY_IMPORTS_AVAILABLE
 
@@ -136,6 +146,152 @@ class TestBasicSimulation(unittest.TestCase):
         self.assertGreater(len(hotspot_stats), 0)
         self.assertIn('final_metrics', summary)
 
+    def test_cached_reports_are_copies(self):
+        """Test that mutating a returned report does not affect later calls."""
+        model = TourismModel(
+            personas_data=self.personas,
+            hotspots_data=self.hotspots,
+            business_rules=self.business_rules,
+            num_tourists=5,
+            random_seed=42
+        )
+
+        model.run_simulation(steps=2)
+
+        hotspot_stats = model.get_hotspot_statistics()
+        persona_stats = model.get_persona_statistics()
+        summary = model.get_summary_report()
+        expected = (len(hotspot_stats), sum(stats["count"] for stats in persona_stats.values()),
+                    summary["final_metrics"]["total_visitors"])
+
+        hotspot_stats.clear()
+        for stats in persona_stats.values():
+            stats["count"] = 0
+        summary["final_metrics"]["total_visitors"] = -1
+
+        self.assertEqual(
+            (len(model.get_hotspot_statistics()),
+             sum(stats["count"] for stats in model.get_persona_statistics().values()),
+             model.get_summary_report()["final_metrics"]["total_visitors"]),
+            expected
+        )
+
+    def test_scenario_modified_after_construction(self):
+        """Test that events added to a running model's scenario still fire."""
+        def build(scenario):
+            return ScenarioAwareTourismModel(
+                scenario,
+                personas_data=self.personas,
+                hotspots_data=self.hotspots,
+                business_rules=self.business_rules,
+                num_tourists=10,
+                random_seed=42
+            )
+
+        upfront = TourismScenario(name="Upfront", description="Event known at construction")
+        upfront.add_event(2, "appeal_boost", "all", {"appeal_boost": 0.5})
+        expected = build(upfront).run_simulation(steps=4)
+
+        later = TourismScenario(name="Later", description="Event added after construction")
+        model = build(later)
+        later.add_event(2, "appeal_boost", "all", {"appeal_boost": 0.5})
+
+        self.assertTrue(model.run_simulation(steps=4).equals(expected))
+
+    def test_scenario_swap_resets_modifiers(self):
+        """Test that swapping in an empty scenario mid-run resets tourist modifiers."""
+        scenario = TourismScenario(name="Excitement", description="External factor only")
+        scenario.add_external_factor("event_excitement", 0.6)
+
+        model = ScenarioAwareTourismModel(
+            scenario,
+            personas_data=self.personas,
+            hotspots_data=self.hotspots,
+            business_rules=self.business_rules,
+            num_tourists=10,
+            random_seed=42
+        )
+        model.step()
+
+        model.set_scenario(TourismScenario(name="Empty", description="No events or factors"))
+        model.step()
+        model.step()
+
+        for tourist in model.tourists:
+            self.assertEqual(list(tourist.scenario_modifiers), [0.0, 1.0, 1.0, 1.0, 1.0])
+
+    def test_batched_stepping(self):
+        """Test stepping tourists phase by phase over arrays."""
+        model = TourismModel(
+            personas_data=self.personas,
+            hotspots_data=self.hotspots,
+            business_rules=self.business_rules,
+            num_tourists=10,
+            random_seed=42,
+            batched_stepping=True
+        )
+
+        results = model.run_simulation(steps=3)
+
+        self.assertEqual(len(results), 3)
+        self.assertGreater(sum(tourist.total_visits for tourist in model.tourists), 0)
+        for tourist in model.tourists:
+            self.assertTrue(0 <= tourist.satisfaction <= 1)
+
+    def test_agent_slots(self):
+        """Test that agents keep their own state in __slots__."""
+        model = TourismModel(
+            personas_data=self.personas,
+            hotspots_data=self.hotspots,
+            business_rules=self.business_rules,
+            num_tourists=5,
+            random_seed=42
+        )
+
+        model.run_simulation(steps=2)
+
+        # Only Mesa's Agent base attributes live in the instance __dict__
+        for agent in model.tourists + model.hotspots:
+            self.assertEqual(set(vars(agent)), {'model', 'unique_id', 'pos'})
+
+    def test_tourist_density(self):
+        """Test that the position array tracks tourists on the grid."""
+        model = TourismModel(
+            personas_data=self.personas,
+            hotspots_data=self.hotspots,
+            business_rules=self.business_rules,
+            num_tourists=10,
+            random_seed=42
+        )
+
+        model.run_simulation(steps=2)
+
+        density = model.tourist_density()
+        self.assertEqual(density.shape, (model.grid.width, model.grid.height))
+        self.assertEqual(density.sum(), 10)
+        for tourist in model.tourists:
+            self.assertGreater(density[tourist.pos], 0)
+
+    def test_batch_run(self):
+        """Test running seeded simulations in parallel."""
+        kwargs = dict(
+            personas_data=self.personas,
+            hotspots_data=self.hotspots,
+            business_rules=self.business_rules,
+            n_runs=2,
+            steps=3,
+            num_tourists=5,
+            seeds=[1, 2]
+        )
+
+        parallel = run_batch(processes=2, **kwargs)
+        serial = run_batch(processes=1, **kwargs)
+
+        self.assertEqual(len(parallel), 2)
+        for parallel_data, serial_data in zip(parallel, serial):
+            self.assertEqual(len(parallel_data), 3)
+            self.assertTrue(parallel_data.equals(serial_data))
+
 
 @unittest.skipUnless(HEAVY_IMPORTS_AVAILABLE, "Heavy imports not available")
 class TestScenarioSystem(unittest.TestCase):
@@ -215,6 +371,190 @@ class TestAnalysis(unittest.TestCase):
         self.assertIn('recommendations', analysis)
 
 
+@unittest.skipUnless(HEAVY_IMPORTS_AVAILABLE, "Heavy imports not available")
+class TestHotspotAnalysis(unittest.TestCase):
+    """Test hotspot analysis on hand-written statistics."""
+
+    def test_fractional_counts(self):
+        """Test that fractional visitor and share counts are not truncated."""
+        hotspot_stats = [
+            {"Name": "A", "Category": "culture", "Current_Popularity": 0.5,
+             "Total_Visitors": 2.4, "Social_Shares": 1.5},
+            {"Name": "B", "Category": "nature", "Current_Popularity": 0.2,
+             "Total_Visitors": 3.5, "Social_Shares": 0},
+            {"Name": "C", "Category": "culture", "Current_Popularity": 0.9,
+             "Total_Visitors": 0}
+        ]
+
+        analysis = analyze_hotspots(hotspot_stats)
+        summary = analysis["summary_statistics"]
+
+        self.assertAlmostEqual(summary["total_visitors"], 5.9)
+        self.assertAlmostEqual(summary["avg_visitors_per_hotspot"], 2.0)
+        self.assertAlmostEqual(summary["total_social_shares"], 1.5)
+        self.assertAlmostEqual(analysis["category_performance"]["culture"]["total_visitors"], 2.4)
+        self.assertEqual(analysis["top_performers"]["most_visited"]["name"], "B")
+
+    def test_integer_counts(self):
+        """Test that integer counts keep integer totals."""
+        hotspot_stats = [
+            {"Name": "A", "Current_Popularity": 0.5, "Total_Visitors": 2, "Social_Shares": 1},
+            {"Name": "B", "Current_Popularity": 0.2, "Total_Visitors": 3}
+        ]
+
+        summary = analyze_hotspots(hotspot_stats)["summary_statistics"]
+
+        self.assertEqual(summary["total_visitors"], 5)
+        self.assertIsInstance(summary["total_visitors"], int)
+        self.assertEqual(summary["total_social_shares"], 1)
+
+
+@unittest.skipUnless(NUMBA_AVAILABLE, "numba not available")
+class TestTrendStatistics(unittest.TestCase):
+    """Test that the numba trend kernel matches the NumPy path."""
+
+    def setUp(self):
+        """Set up random time series."""
+        rng = np.random.default_rng(7)
+        self.values = rng.random((40, 6)) * 100
+
+    def test_kernel_matches_numpy(self):
+        """Test slopes and volatilities on random data."""
+        slopes, volatilities = analysis_module._trend_statistics(self.values)
+        expected_slopes, expected_volatilities = analysis_module._trend_statistics_numpy(self.values)
+
+        np.testing.assert_allclose(slopes, expected_slopes, rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(volatilities, expected_volatilities, rtol=1e-12, atol=1e-12)
+
+    def test_analyze_trends(self):
+        """Test that analyze_trends reports the same trends through either path."""
+        model_data = pd.DataFrame(self.values, columns=[f"metric_{i}" for i in range(self.values.shape[1])])
+        model_data["constant"] = 1.0
+
+        trends = analyze_trends(model_data)
+        with mock.patch.object(analysis_module, "_trend_statistics", analysis_module._trend_statistics_numpy):
+            expected = analyze_trends(model_data)
+
+        self.assertEqual(trends, expected)
+
+
+@unittest.skipUnless(NUMBA_AVAILABLE, "numba not available")
+class TestHotspotChoice(unittest.TestCase):
+    """Test that the numba hotspot picker matches the NumPy path."""
+
+    def test_picker_matches_numpy(self):
+        """Test both pickers choose the same hotspot for fixed random draws."""
+        rng = np.random.default_rng(11)
+        n_hotspots = 12
+        model = SimpleNamespace(
+            appeal_matrix=rng.random((3, n_hotspots)),
+            _hs_pos=rng.integers(0, 20, size=(n_hotspots, 2)).astype(np.float64)
+        )
+
+        for _ in range(200):
+            tourist = SimpleNamespace(
+                model=model,
+                _persona_idx=int(rng.integers(0, 3)),
+                _rec_boost=rng.random(n_hotspots) * rng.integers(0, 2),
+                _visited_mask=rng.random(n_hotspots) < 0.3,
+                pos=(int(rng.integers(0, 20)), int(rng.integers(0, 20))),
+                exploration_tendency=float(rng.random())
+            )
+            popularity = rng.random(n_hotspots)
+            u = float(rng.random())
+
+            chosen = tourist_module._score_and_pick(
+                model.appeal_matrix[tourist._persona_idx], popularity, tourist._rec_boost,
+                float(tourist.pos[0]), float(tourist.pos[1]), model._hs_pos,
+                tourist._visited_mask, tourist.exploration_tendency, u
+            )
+            expected = tourist_module.Tourist._score_and_pick_numpy(tourist, popularity, u)
+
+            self.assertEqual(chosen, expected)
+
+
+@unittest.skipUnless(HEAVY_IMPORTS_AVAILABLE, "Heavy imports not available")
+class TestJsonExport(unittest.TestCase):
+    """Test that exported JSON does not depend on optional encoders."""
+
+    SAMPLES = [
+        {"Cultural Explorer": {"count": 3, "avg_satisfaction": 0.512, "total_visits": 9}},
+        [{"name": "Old Port", "current_popularity": 0.25, "social_shares": 0}],
+        {"nan": float("nan"), "inf": float("inf"), "tiny": 1e-07, "huge": 1e20},
+        {1: "int key", None: "none key", True: "bool key", "café": "non-ASCII"},
+        {"empty": {}, "nested": [[], {"a": (1, 2)}]}
+    ]
+
+    def _export(self, data):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "stats.json")
+            quick_visualize._write_json(data, path)
+            with open(path, "rb") as f:
+                return f.read()
+
+    def test_matches_stdlib_output(self):
+        """Test that the default encoder path matches json.dump(indent=2)."""
+        for data in self.SAMPLES:
+            self.assertEqual(self._export(data), json.dumps(data, indent=2).encode())
+
+    def test_stdlib_fallback(self):
+        """Test the export path used when orjson is not installed."""
+        with mock.patch.object(quick_visualize, "ORJSON_AVAILABLE", False):
+            for data in self.SAMPLES:
+                self.assertEqual(self._export(data), json.dumps(data, indent=2).encode())
+
+
+@unittest.skipUnless(HEAVY_IMPORTS_AVAILABLE, "Heavy imports not available")
+class TestRenderedChartCache(unittest.TestCase):
+    """Test reuse of charts rendered earlier in the session."""
+
+    def setUp(self):
+        """Set up a chart file and an empty cache."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.saved_files = {"popularity": os.path.join(self.tmp_dir.name, "popularity_evolution.png")}
+        with open(self.saved_files["popularity"], "wb") as f:
+            f.write(b"png")
+
+        patcher = mock.patch.object(quick_visualize, "_RENDERED_CHARTS", {})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_hit(self):
+        """Test that unchanged files are reused."""
+        quick_visualize._remember_charts("key", self.saved_files)
+
+        self.assertEqual(quick_visualize._cached_charts("key"), self.saved_files)
+
+    def test_miss(self):
+        """Test that unknown inputs and deleted files are not reused."""
+        quick_visualize._remember_charts("key", self.saved_files)
+
+        self.assertIsNone(quick_visualize._cached_charts("other"))
+        self.assertIsNone(quick_visualize._cached_charts(None))
+        os.remove(self.saved_files["popularity"])
+        self.assertIsNone(quick_visualize._cached_charts("key"))
+
+    def test_touched_file(self):
+        """Test that a file modified since rendering is not reused."""
+        quick_visualize._remember_charts("key", self.saved_files)
+        path = self.saved_files["popularity"]
+        mtime = os.path.getmtime(path)
+        os.utime(path, (mtime + 10, mtime + 10))
+
+        self.assertIsNone(quick_visualize._cached_charts("key"))
+
+    def test_bounded(self):
+        """Test that the oldest render is evicted once the cache is full."""
+        size = quick_visualize._RENDERED_CHARTS_SIZE
+        for i in range(size + 1):
+            quick_visualize._remember_charts(f"key{i}", self.saved_files)
+
+        self.assertEqual(len(quick_visualize._RENDERED_CHARTS), size)
+        self.assertIsNone(quick_visualize._cached_charts("key0"))
+        self.assertEqual(quick_visualize._cached_charts(f"key{size}"), self.saved_files)
+
+
 def run_tests():
     """Run all tests and display results."""
     print("🧪 LLM Tourism Simulation - Test Suite")
@@ -234,7 +574,12 @@ def run_tests():
         TestDataLoading,
         TestBasicSimulation, 
         TestScenarioSystem,
-        TestAnalysis
+        TestAnalysis,
+        TestHotspotAnalysis,
+        TestTrendStatistics,
+        TestHotspotChoice,
+        TestJsonExport,
+        TestRenderedChartCache
     ]
 
     for test_class in test_classes:
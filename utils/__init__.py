@@ -5,21 +5,42 @@ Utility Modules
 Analysis, visualization, and storage utilities.
 """
 
+import importlib
+import warnings
+
 from .analysis import analyze_simulation_results, compare_scenarios, generate_policy_recommendations
-from .visualization import create_popularity_chart, create_satisfaction_chart, create_scenario_comparison
 from .results_storage import ResultsStorage, get_latest_output_dir, list_output_directories
-from .quick_visualize import (
-    quick_visualize_simulation,
-    quick_compare_scenarios,
-    quick_summary_report,
-    add_visualization_to_existing_simulation
-)
 from .scenario_builder import (
     ScenarioBuilder,
     create_quick_comparison_set,
     create_extreme_comparison_set
 )
 
+# Importing the package has always silenced warnings (previously as a side effect
+# of loading the visualization module); keep that now that charts load lazily
+warnings.filterwarnings('ignore')
+
+# Chart utilities pull in matplotlib and seaborn, so they are imported on first use
+_LAZY_IMPORTS = {
+    'create_popularity_chart': '.visualization',
+    'create_satisfaction_chart': '.visualization',
+    'create_scenario_comparison': '.visualization',
+    'quick_visualize_simulation': '.quick_visualize',
+    'quick_compare_scenarios': '.quick_visualize',
+    'quick_summary_report': '.quick_visualize',
+    'add_visualization_to_existing_simulation': '.quick_visualize'
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     'analyze_simulation_results',
     'compare_scenarios',
@@ -6,11 +6,116 @@ This module provides functions for analyzing tourism simulation results,
 calculating metrics, generating insights, and creating policy recommendations.
 """
 
+import heapq
+from operator import itemgetter
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional, Tuple
-from collections import defaultdict
-import statistics
+
+# numba is optional; without it trend statistics use the NumPy path
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _trend_statistics_numpy(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Least-squares slope and step volatility of every column of a (T, C) array.
+
+    Returns:
+        Tuple of (slopes, volatilities), one entry per column
+    """
+    x = np.arange(len(values), dtype=np.float64)
+    x_centered = x - x.mean()
+    slopes = (x_centered[:, None] * (values - values.mean(axis=0))).sum(axis=0) / (x_centered * x_centered).sum()
+    volatilities = np.diff(values, axis=0).std(axis=0)
+    return slopes, volatilities
+
+
+def _trend_statistics_kernel(values):
+    """
+    Column-parallel equivalent of _trend_statistics_numpy for numba.
+    """
+    n_rows, n_cols = values.shape
+    slopes = np.empty(n_cols)
+    volatilities = np.empty(n_cols)
+    x_centered = np.arange(n_rows) - (n_rows - 1) / 2.0
+    denominator = (x_centered * x_centered).sum()
+    for j in prange(n_cols):
+        column = values[:, j]
+        slopes[j] = (x_centered * (column - column.mean())).sum() / denominator
+        volatilities[j] = np.diff(column).std()
+    return slopes, volatilities
+
+
+if NUMBA_AVAILABLE:
+    _trend_statistics = njit(cache=True, parallel=True)(_trend_statistics_kernel)
+else:
+    _trend_statistics = _trend_statistics_numpy
+
+
+# Numeric column names per DataFrame schema, shared across repeated analyses;
+# bounded so long-running processes with many schemas don't grow it forever
+_NUMERIC_COLUMNS_CACHE: Dict[Tuple, List[Any]] = {}
+_NUMERIC_COLUMNS_CACHE_SIZE = 128
+
+
+def _numeric_columns(data: pd.DataFrame) -> List[Any]:
+    """
+    Return the numeric column names of a DataFrame, cached by its schema.
+
+    Args:
+        data: DataFrame to inspect
+
+    Returns:
+        List of numeric column names in frame order
+    """
+    schema = tuple(data.dtypes.items())
+    columns = _NUMERIC_COLUMNS_CACHE.get(schema)
+    if columns is None:
+        columns = data.select_dtypes(include=[np.number]).columns.tolist()
+        if len(_NUMERIC_COLUMNS_CACHE) >= _NUMERIC_COLUMNS_CACHE_SIZE:
+            # Evict the oldest schema
+            del _NUMERIC_COLUMNS_CACHE[next(iter(_NUMERIC_COLUMNS_CACHE))]
+        _NUMERIC_COLUMNS_CACHE[schema] = columns
+    return columns
+
+
+# Trend direction labels indexed by direction code
+_TREND_DIRECTIONS = np.array(["stable", "increasing", "decreasing"], dtype=object)
+
+# Numeric hotspot statistics packed into columns
+_HOTSPOT_STATS_FIELDS = ("Current_Popularity", "Total_Visitors", "Social_Shares")
+
+
+# C-level field readers
+_PERCENT_CHANGE = itemgetter("percent_change")
+_SCORE = itemgetter("score")
+
+
+def _hotspots_to_struct(hotspot_stats: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Pack the numeric fields of hotspot statistics into a structured array.
+
+    Each field's dtype is inferred from its values, so integer counts stay
+    integers while fractional counts (e.g. scaled or averaged inputs) are
+    kept as floats rather than truncated.
+
+    Args:
+        hotspot_stats: List of hotspot statistics
+
+    Returns:
+        Structured array with one record per hotspot
+    """
+    # Missing fields default to zero
+    columns = [np.array([h.get(field, 0) for h in hotspot_stats]) for field in _HOTSPOT_STATS_FIELDS]
+    records = np.empty(len(hotspot_stats),
+                       dtype=[(field, column.dtype) for field, column in zip(_HOTSPOT_STATS_FIELDS, columns)])
+    for field, column in zip(_HOTSPOT_STATS_FIELDS, columns):
+        records[field] = column
+    return records
 
 
 def analyze_simulation_results(model_data: pd.DataFrame, 
@@ -37,17 +142,24 @@ def analyze_simulation_results(model_data: pd.DataFrame,
     }
 
     # Simulation overview
+    total_steps = len(model_data)
+    has_model_data = total_steps > 0 and not model_data.empty
     analysis["simulation_overview"] = {
-        "total_steps": len(model_data) if not model_data.empty else 0,
+        "total_steps": total_steps if has_model_data else 0,
         "total_hotspots": len(hotspot_stats),
         "total_personas": len(persona_stats),
-        "data_quality": "complete" if not model_data.empty else "incomplete"
+        "data_quality": "complete" if has_model_data else "incomplete"
     }
 
     # Performance metrics
-    if not model_data.empty:
-        final_metrics = model_data.iloc[-1] if len(model_data) > 0 else {}
-        initial_metrics = model_data.iloc[0] if len(model_data) > 0 else {}
+    if has_model_data:
+        # Read the first and last rows of the headline columns as plain arrays
+        metric_columns = [column for column in ("Average_Popularity", "Average_Satisfaction",
+                                                "Total_Visitors", "Social_Shares")
+                          if column in model_data.columns]
+        metric_values = model_data[metric_columns].to_numpy()
+        final_metrics = dict(zip(metric_columns, metric_values[-1]))
+        initial_metrics = dict(zip(metric_columns, metric_values[0]))
 
         analysis["performance_metrics"] = {
             "final_popularity": float(final_metrics.get("Average_Popularity", 0)),
@@ -69,7 +181,7 @@ def analyze_simulation_results(model_data: pd.DataFrame,
         analysis["persona_analysis"] = persona_analysis
 
     # Trend analysis
-    if not model_data.empty:
+    if has_model_data:
         trend_analysis = analyze_trends(model_data)
         analysis["trend_analysis"] = trend_analysis
 
@@ -93,61 +205,73 @@ def analyze_hotspots(hotspot_stats: List[Dict[str, Any]]) -> Dict[str, Any]:
     if not hotspot_stats:
         return {"error": "No hotspot data provided"}
 
-    # Calculate summary statistics
-    popularity_scores = [h.get("Current_Popularity", 0) for h in hotspot_stats]
-    visitor_counts = [h.get("Total_Visitors", 0) for h in hotspot_stats]
-    social_shares = [h.get("Social_Shares", 0) for h in hotspot_stats]
-
-    # Find top performers
-    sorted_by_popularity = sorted(hotspot_stats, key=lambda x: x.get("Current_Popularity", 0), reverse=True)
-    sorted_by_visitors = sorted(hotspot_stats, key=lambda x: x.get("Total_Visitors", 0), reverse=True)
-    sorted_by_shares = sorted(hotspot_stats, key=lambda x: x.get("Social_Shares", 0), reverse=True)
-
-    # Category analysis
-    category_stats = defaultdict(lambda: {"count": 0, "avg_popularity": 0, "total_visitors": 0})
-
-    for hotspot in hotspot_stats:
-        category = hotspot.get("Category", "unknown")
-        category_stats[category]["count"] += 1
-        category_stats[category]["avg_popularity"] += hotspot.get("Current_Popularity", 0)
-        category_stats[category]["total_visitors"] += hotspot.get("Total_Visitors", 0)
-
-    # Calculate averages
-    for category, stats in category_stats.items():
-        if stats["count"] > 0:
-            stats["avg_popularity"] /= stats["count"]
+    # Columnar arrays make every statistic a vectorized scan
+    records = _hotspots_to_struct(hotspot_stats)
+    popularity_scores = records["Current_Popularity"]
+    visitor_counts = records["Total_Visitors"]
+    social_shares = records["Social_Shares"]
+
+    # Find top performers (argmax keeps the first of tied hotspots)
+    most_popular = hotspot_stats[popularity_scores.argmax()]
+    most_visited = hotspot_stats[visitor_counts.argmax()]
+    most_shared = hotspot_stats[social_shares.argmax()]
+
+    # Two least popular hotspots, in descending popularity order
+    avg_popularity = popularity_scores.mean()
+    underperformer_threshold = avg_popularity * 0.7
+    least_popular = heapq.nsmallest(2, range(len(popularity_scores) - 1, -1, -1),
+                                    key=popularity_scores.__getitem__)[::-1]
+
+    # Category analysis, with categories in order of first appearance
+    category_index = {}
+    category_codes = np.fromiter(
+        (category_index.setdefault(h.get("Category", "unknown"), len(category_index)) for h in hotspot_stats),
+        dtype=np.intp, count=len(hotspot_stats)
+    )
+    category_counts = np.bincount(category_codes)
+    category_popularity = np.bincount(category_codes, weights=popularity_scores) / category_counts
+    category_visitors = np.bincount(category_codes, weights=visitor_counts)
+    if visitor_counts.dtype.kind in "biu":
+        category_visitors = category_visitors.astype(np.int64)
+    category_stats = {
+        category: {"count": count, "avg_popularity": popularity, "total_visitors": visitors}
+        for category, count, popularity, visitors in zip(category_index, category_counts.tolist(),
+                                                         category_popularity.tolist(),
+                                                         category_visitors.tolist())
+    }
 
     return {
         "summary_statistics": {
             "total_hotspots": len(hotspot_stats),
-            "avg_popularity": round(np.mean(popularity_scores), 3),
+            "avg_popularity": round(avg_popularity, 3),
             "popularity_std": round(np.std(popularity_scores), 3),
-            "total_visitors": sum(visitor_counts),
+            # Summed in Python, like the per-field totals were before packing
+            "total_visitors": sum(visitor_counts.tolist()),
             "avg_visitors_per_hotspot": round(np.mean(visitor_counts), 1),
-            "total_social_shares": sum(social_shares)
+            "total_social_shares": sum(social_shares.tolist())
         },
         "top_performers": {
             "most_popular": {
-                "name": sorted_by_popularity[0].get("Name", "Unknown"),
-                "popularity": sorted_by_popularity[0].get("Current_Popularity", 0)
-            } if sorted_by_popularity else None,
+                "name": most_popular.get("Name", "Unknown"),
+                "popularity": most_popular.get("Current_Popularity", 0)
+            },
             "most_visited": {
-                "name": sorted_by_visitors[0].get("Name", "Unknown"), 
-                "visitors": sorted_by_visitors[0].get("Total_Visitors", 0)
-            } if sorted_by_visitors else None,
+                "name": most_visited.get("Name", "Unknown"), 
+                "visitors": most_visited.get("Total_Visitors", 0)
+            },
             "most_shared": {
-                "name": sorted_by_shares[0].get("Name", "Unknown"),
-                "shares": sorted_by_shares[0].get("Social_Shares", 0)
-            } if sorted_by_shares else None
+                "name": most_shared.get("Name", "Unknown"),
+                "shares": most_shared.get("Social_Shares", 0)
+            }
         },
-        "category_performance": dict(category_stats),
+        "category_performance": category_stats,
         "underperformers": [
             {
-                "name": h.get("Name", "Unknown"),
-                "popularity": h.get("Current_Popularity", 0),
-                "visitors": h.get("Total_Visitors", 0)
+                "name": hotspot_stats[i].get("Name", "Unknown"),
+                "popularity": hotspot_stats[i].get("Current_Popularity", 0),
+                "visitors": hotspot_stats[i].get("Total_Visitors", 0)
             }
-            for h in sorted_by_popularity[-2:] if h.get("Current_Popularity", 0) < np.mean(popularity_scores) * 0.7
+            for i in least_popular if popularity_scores[i] < underperformer_threshold
         ]
     }
 
@@ -170,9 +294,10 @@ def analyze_personas(persona_stats: Dict[str, Dict[str, Any]]) -> Dict[str, Any]
     visit_counts = [stats.get("avg_visits", 0) for stats in persona_stats.values()]
     recommendation_counts = [stats.get("avg_recommendations", 0) for stats in persona_stats.values()]
 
-    # Find top and bottom performers
-    sorted_by_satisfaction = sorted(persona_stats.items(), 
-                                  key=lambda x: x[1].get("avg_satisfaction", 0), reverse=True)
+    # Find top and bottom performers (first of tied highest, last of tied lowest)
+    persona_items = list(persona_stats.items())
+    highest = max(persona_items, key=lambda x: x[1].get("avg_satisfaction", 0))
+    lowest = min(reversed(persona_items), key=lambda x: x[1].get("avg_satisfaction", 0))
 
     # Analyze persona diversity
     satisfaction_range = max(satisfaction_scores) - min(satisfaction_scores) if satisfaction_scores else 0
@@ -188,13 +313,13 @@ def analyze_personas(persona_stats: Dict[str, Dict[str, Any]]) -> Dict[str, Any]
         },
         "persona_rankings": {
             "highest_satisfaction": {
-                "persona": sorted_by_satisfaction[0][0],
-                "satisfaction": sorted_by_satisfaction[0][1].get("avg_satisfaction", 0)
-            } if sorted_by_satisfaction else None,
+                "persona": highest[0],
+                "satisfaction": highest[1].get("avg_satisfaction", 0)
+            },
             "lowest_satisfaction": {
-                "persona": sorted_by_satisfaction[-1][0],
-                "satisfaction": sorted_by_satisfaction[-1][1].get("avg_satisfaction", 0) 
-            } if sorted_by_satisfaction else None
+                "persona": lowest[0],
+                "satisfaction": lowest[1].get("avg_satisfaction", 0)
+            }
         },
         "behavioral_insights": _generate_persona_insights(persona_stats),
         "persona_distribution": {
@@ -220,36 +345,40 @@ def analyze_trends(model_data: pd.DataFrame) -> Dict[str, Any]:
     trends = {}
 
     # Analyze each numeric column
-    numeric_columns = model_data.select_dtypes(include=[np.number]).columns
+    numeric_columns = _numeric_columns(model_data)
 
-    for column in numeric_columns:
-        if len(model_data[column]) > 1:
-            # Calculate trend
-            x = np.arange(len(model_data))
-            y = model_data[column].values
+    if len(model_data) > 1:
+        values = model_data[numeric_columns].to_numpy(dtype=np.float64)
 
-            # Linear regression for trend
-            slope, intercept = np.polyfit(x, y, 1)
+        # Constant columns are flat by definition; fit only the varying ones
+        varying = values.max(axis=0) != values.min(axis=0)
+        slopes = np.zeros(values.shape[1])
+        volatilities = np.zeros(values.shape[1])
+        if varying.any():
+            slopes[varying], volatilities[varying] = _trend_statistics(values[:, varying])
 
-            # Calculate volatility
-            volatility = np.std(np.diff(y)) if len(y) > 1 else 0
+        # Relative change of every column from its first and last rows
+        percent_changes = ((values[-1] - values[0]) / np.maximum(np.abs(values[0]), 0.001)) * 100
 
-            # Determine trend direction
-            if abs(slope) < 0.001:
-                direction = "stable"
-            elif slope > 0:
-                direction = "increasing"
-            else:
-                direction = "decreasing"
+        # Classify every trend direction with masks instead of a per-column branch
+        directions = _TREND_DIRECTIONS[np.where(np.abs(slopes) < 0.001, 0, np.where(slopes > 0, 1, 2))]
+
+        # Round each statistic for the whole block at once
+        rounded_slopes = np.round(slopes, 6)
+        rounded_volatilities = np.round(volatilities, 4)
+        rounded_percent_changes = np.round(percent_changes, 2)
+
+        for j, column in enumerate(numeric_columns):
+            y = model_data[column].to_numpy()
 
             trends[column] = {
-                "direction": direction,
-                "slope": round(slope, 6),
-                "volatility": round(volatility, 4),
+                "direction": directions[j],
+                "slope": rounded_slopes[j],
+                "volatility": rounded_volatilities[j],
                 "initial_value": round(y[0], 3),
                 "final_value": round(y[-1], 3),
                 "total_change": round(y[-1] - y[0], 3),
-                "percent_change": round(((y[-1] - y[0]) / max(abs(y[0]), 0.001)) * 100, 2)
+                "percent_change": rounded_percent_changes[j]
             }
 
     return {
@@ -286,9 +415,33 @@ def compare_scenarios(baseline_results: Dict[str, Any],
 
     baseline_metrics = baseline_results.get("performance_metrics", {})
 
+    metrics = list(baseline_metrics)
+    baseline_rounded = [round(baseline_metrics[metric], 3) for metric in metrics]
+    scenario_metrics_list = [scenario_result.get("performance_metrics", {}) for scenario_result in scenario_results]
+
+    # Stack baseline (M,) and scenarios (K, M) and diff them in one broadcast
+    baseline_values = np.array([baseline_metrics[metric] for metric in metrics], dtype=np.float64)
+    scenario_values = np.array(
+        [[scenario_metrics.get(metric, 0) for metric in metrics] for scenario_metrics in scenario_metrics_list],
+        dtype=np.float64
+    ).reshape(len(scenario_results), len(metrics))
+
+    changes = scenario_values - baseline_values
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percent_changes = np.where(baseline_values != 0,
+                                   (changes / np.abs(baseline_values)) * 100,
+                                   np.where(scenario_values == 0, 0.0, 100.0))
+
+    # Count positive/negative changes (more than 1% improvement or decline)
+    positive_changes = (percent_changes > 1).sum(axis=1)
+    negative_changes = (percent_changes < -1).sum(axis=1)
+
+    rounded_changes = np.round(changes, 3).tolist()
+    rounded_percent_changes = np.round(percent_changes, 2).tolist()
+
     # Compare each scenario to baseline
-    for scenario_result in scenario_results:
-        scenario_metrics = scenario_result.get("performance_metrics", {})
+    for i, scenario_result in enumerate(scenario_results):
+        scenario_metrics = scenario_metrics_list[i]
         scenario_name = scenario_result.get("scenario_name", "Unknown")
 
         scenario_comparison = {
@@ -297,36 +450,19 @@ def compare_scenarios(baseline_results: Dict[str, Any],
             "overall_impact": "neutral"
         }
 
-        positive_changes = 0
-        negative_changes = 0
-
-        for metric, baseline_value in baseline_metrics.items():
-            scenario_value = scenario_metrics.get(metric, 0)
-
-            if baseline_value != 0:
-                change = scenario_value - baseline_value
-                percent_change = (change / abs(baseline_value)) * 100
-            else:
-                change = scenario_value
-                percent_change = 0 if scenario_value == 0 else 100
-
+        for metric, baseline_value, change, percent_change in zip(metrics, baseline_rounded,
+                                                                  rounded_changes[i], rounded_percent_changes[i]):
             scenario_comparison["metric_changes"][metric] = {
-                "baseline": round(baseline_value, 3),
-                "scenario": round(scenario_value, 3),
-                "absolute_change": round(change, 3),
-                "percent_change": round(percent_change, 2)
+                "baseline": baseline_value,
+                "scenario": round(scenario_metrics.get(metric, 0), 3),
+                "absolute_change": change,
+                "percent_change": percent_change
             }
 
-            # Count positive/negative changes
-            if percent_change > 1:  # More than 1% improvement
-                positive_changes += 1
-            elif percent_change < -1:  # More than 1% decline
-                negative_changes += 1
-
         # Determine overall impact
-        if positive_changes > negative_changes:
+        if positive_changes[i] > negative_changes[i]:
             scenario_comparison["overall_impact"] = "positive"
-        elif negative_changes > positive_changes:
+        elif negative_changes[i] > positive_changes[i]:
             scenario_comparison["overall_impact"] = "negative"
 
         comparison["scenario_comparisons"].append(scenario_comparison)
@@ -353,16 +489,22 @@ def calculate_satisfaction_metrics(satisfaction_data: List[float]) -> Dict[str,
     if not satisfaction_data:
         return {"error": "No satisfaction data provided"}
 
-    return {
-        "mean": round(statistics.mean(satisfaction_data), 3),
-        "median": round(statistics.median(satisfaction_data), 3),
-        "std_dev": round(statistics.stdev(satisfaction_data) if len(satisfaction_data) > 1 else 0, 3),
-        "min": round(min(satisfaction_data), 3),
-        "max": round(max(satisfaction_data), 3),
-        "range": round(max(satisfaction_data) - min(satisfaction_data), 3),
-        "q25": round(np.percentile(satisfaction_data, 25), 3),
-        "q75": round(np.percentile(satisfaction_data, 75), 3)
+    scores = np.asarray(satisfaction_data, dtype=np.float64)
+
+    # One sort yields every order statistic
+    minimum, q25, median, q75, maximum = np.quantile(scores, [0.0, 0.25, 0.5, 0.75, 1.0])
+
+    metrics = {
+        "mean": scores.mean(),
+        "median": median,
+        "std_dev": scores.std(ddof=1) if scores.size > 1 else 0,
+        "min": minimum,
+        "max": maximum,
+        "range": maximum - minimum,
+        "q25": q25,
+        "q75": q75
     }
+    return dict(zip(metrics, np.round(np.array(list(metrics.values()), dtype=np.float64), 3).tolist()))
 
 
 def generate_policy_recommendations(analysis_results: Dict[str, Any]) -> List[Dict[str, str]]:
@@ -434,21 +576,23 @@ def _generate_persona_insights(persona_stats: Dict[str, Dict[str, Any]]) -> List
 
     # Find most/least satisfied personas
     if persona_stats:
-        sorted_satisfaction = sorted(persona_stats.items(), 
-                                   key=lambda x: x[1].get("avg_satisfaction", 0), reverse=True)
-
-        highest = sorted_satisfaction[0]
-        lowest = sorted_satisfaction[-1]
+        # One pass keeps the first tied highest/most active and the last tied lowest
+        highest = lowest = most_active = None
+        for item in persona_stats.items():
+            satisfaction = item[1].get("avg_satisfaction", 0)
+            visits = item[1].get("avg_visits", 0)
+            if highest is None or satisfaction > highest[1].get("avg_satisfaction", 0):
+                highest = item
+            if lowest is None or satisfaction <= lowest[1].get("avg_satisfaction", 0):
+                lowest = item
+            if most_active is None or visits > most_active[1].get("avg_visits", 0):
+                most_active = item
 
         insights.append(f"{highest[0]} shows highest satisfaction ({highest[1].get('avg_satisfaction', 0):.3f})")
         insights.append(f"{lowest[0]} shows lowest satisfaction ({lowest[1].get('avg_satisfaction', 0):.3f})")
 
         # Find most active persona
-        sorted_visits = sorted(persona_stats.items(), 
-                             key=lambda x: x[1].get("avg_visits", 0), reverse=True)
-        if sorted_visits:
-            most_active = sorted_visits[0]
-            insights.append(f"{most_active[0]} is most active with {most_active[1].get('avg_visits', 0):.1f} average visits")
+        insights.append(f"{most_active[0]} is most active with {most_active[1].get('avg_visits', 0):.1f} average visits")
 
     return insights
 
@@ -483,20 +627,17 @@ def _rank_scenarios(scenario_comparisons: List[Dict[str, Any]]) -> Dict[str, Any
         metric_changes = comparison["metric_changes"]
 
         # Simple scoring: sum of positive percent changes
-        total_score = sum(
-            change_data["percent_change"] 
-            for change_data in metric_changes.values()
-            if change_data["percent_change"] > 0
-        )
+        positive_percent_changes = [change for change in map(_PERCENT_CHANGE, metric_changes.values())
+                                    if change > 0]
 
         scenario_scores.append({
             "scenario": scenario_name,
-            "score": total_score,
-            "positive_changes": sum(1 for c in metric_changes.values() if c["percent_change"] > 0)
+            "score": sum(positive_percent_changes),
+            "positive_changes": len(positive_percent_changes)
         })
 
     # Sort by score
-    scenario_scores.sort(key=lambda x: x["score"], reverse=True)
+    scenario_scores.sort(key=_SCORE, reverse=True)
 
     return {
         "best_scenario": scenario_scores[0]["scenario"] if scenario_scores else None,
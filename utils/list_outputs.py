@@ -74,18 +74,20 @@ def explore_output(timestamp=None):
     print(f"🔍 Exploring: {output_dir}")
     print("=" * 40)
     
-    # List contents
-    for item in output_dir.iterdir():
-        if item.is_dir():
-            print(f"📁 {item.name}/")
-            # List subdirectory contents
-            for subitem in item.iterdir():
-                if subitem.is_file():
-                    size = subitem.stat().st_size
-                    print(f"   📄 {subitem.name} ({size} bytes)")
-        else:
-            size = item.stat().st_size
-            print(f"📄 {item.name} ({size} bytes)")
+    # List contents (scandir entries carry their file type from the directory read)
+    with os.scandir(output_dir) as entries:
+        for item in entries:
+            if item.is_dir():
+                print(f"📁 {item.name}/")
+                # List subdirectory contents
+                with os.scandir(item.path) as subentries:
+                    for subitem in subentries:
+                        if subitem.is_file():
+                            size = subitem.stat().st_size
+                            print(f"   📄 {subitem.name} ({size} bytes)")
+            else:
+                size = item.stat().st_size
+                print(f"📄 {item.name} ({size} bytes)")
 
 
 def main():
@@ -7,15 +7,225 @@ to any tourism simulation without requiring complex setup.
 """
 
 import os
+import json
+import hashlib
+import sys
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Any, Optional
-from .visualization import (
-    create_popularity_chart,
-    create_satisfaction_chart,
-    create_time_series_dashboard,
-    save_all_charts
-)
-import matplotlib.pyplot as plt
+from typing import Dict, List, Any, Optional, Tuple
+
+# orjson is optional; without it stats files use the stdlib encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Final-row columns shown in the summary report
+_SUMMARY_METRIC_COLUMNS = ['Average_Popularity', 'Total_Visitors', 'Social_Shares', 'Average_Satisfaction']
+
+# Summary report entries, each formatted in a single call
+_HOTSPOT_ENTRY = "{}. {}\n   Popularity: {:.3f}\n   Visitors: {}\n   Category: {}\n\n"
+_PERSONA_ENTRY = "{}:\n   Count: {}\n   Avg Satisfaction: {:.3f}\n   Avg Visits: {:.1f}\n\n"
+
+# Final metrics compared across scenarios, in table column order
+_COMPARISON_METRICS = ('avg_popularity', 'total_visitors', 'social_shares', 'avg_satisfaction')
+
+# Output file names by result key; paths are "<directory>/<file name>"
+_CHART_FILES = {
+    "popularity": "popularity_evolution.png",
+    "satisfaction": "satisfaction_by_persona.png",
+    "dashboard": "simulation_dashboard.png"
+}
+_COMPARISON_FILES = {
+    "comparison": "scenario_comparison.png",
+    "comparison_table": "scenario_comparison.csv"
+}
+_DATA_FILES = {
+    "model_data": "model_data.csv",
+    "hotspot_stats": "hotspot_stats.json",
+    "persona_stats": "persona_stats.json"
+}
+
+# Chart names (file stems) that save_all_charts need not draw again
+_CHART_NAMES = frozenset(os.path.splitext(file_name)[0] for file_name in _CHART_FILES.values())
+
+
+def _output_paths(directory: str, files: Dict[str, str]) -> Dict[str, str]:
+    """Build every output path for a directory once."""
+    return {key: f"{directory}/{file_name}" for key, file_name in files.items()}
+
+
+# Buffered, chunked CSV export caps peak memory on long simulations
+_CSV_BUFFER_SIZE = 1 << 20
+_CSV_CHUNK_ROWS = 50_000
+
+def _orjson_compatible(value: Any) -> bool:
+    """
+    Whether orjson renders a value byte-identically to json.dump(indent=2).
+    
+    orjson writes NaN/Infinity as null, emits non-ASCII text unescaped,
+    formats very small or large floats differently and rejects NumPy or
+    other non-JSON types under the stdlib's rules; any of those sends the
+    data through the stdlib encoder instead.
+    """
+    kind = type(value)
+    if kind is str:
+        return value.isascii()
+    if kind is float:
+        return value == 0 or 1e-4 <= abs(value) < 1e16
+    if kind is int:
+        return -2 ** 63 <= value < 2 ** 64
+    if kind is bool or value is None:
+        return True
+    if kind is dict:
+        return all(map(_orjson_compatible, value)) and all(map(_orjson_compatible, value.values()))
+    if kind is list or kind is tuple:
+        return all(map(_orjson_compatible, value))
+    return False
+
+
+def _write_json(data: Any, path: str):
+    """Write indented JSON, using orjson's C encoder when it gives the same output."""
+    if ORJSON_AVAILABLE and _orjson_compatible(data):
+        # Non-string keys are coerced to strings, as json.dump does
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+
+def _top_indices(values: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k largest values, ordered like a stable descending sort."""
+    if len(values) > k:
+        # Partition to the k-th largest value, keeping every tie at the boundary
+        kth_largest = np.partition(values, len(values) - k)[len(values) - k]
+        candidates = np.flatnonzero(values >= kth_largest)
+    else:
+        candidates = np.arange(len(values))
+    return candidates[np.argsort(-values[candidates], kind='stable')][:k]
+
+
+def _is_plain_numeric(data: pd.DataFrame) -> bool:
+    """Whether every column is int or float64 without NaN, under a label CSV needn't quote."""
+    for column, dtype in data.dtypes.items():
+        if not isinstance(column, str) or any(char in column for char in ',"\r\n'):
+            return False
+        if not isinstance(dtype, np.dtype) or not (dtype.kind in 'iu' or dtype == np.float64):
+            return False
+    return not data.isna().to_numpy().any()
+
+
+def _write_numeric_csv(data: pd.DataFrame, f):
+    """
+    Write a plain numeric frame as CSV, byte-identical to to_csv(index=False).
+
+    Python's float repr matches pandas' default float formatting, so one
+    format string per row skips pandas' per-cell formatter.
+    """
+    columns = [data[column].tolist() for column in data.columns]
+    row_format = ",".join(["%r"] * len(columns)) + "\n"
+    f.write(",".join(data.columns) + "\n")
+    for start in range(0, len(data), _CSV_CHUNK_ROWS):
+        f.writelines(row_format % row for row in zip(*(column[start:start + _CSV_CHUNK_ROWS] for column in columns)))
+
+
+def _write_model_csv(data: pd.DataFrame, path: str):
+    """Write model data as CSV in bounded row chunks through a large buffer."""
+    with open(path, 'w', newline='', buffering=_CSV_BUFFER_SIZE) as f:
+        if _is_plain_numeric(data):
+            _write_numeric_csv(data, f)
+        else:
+            data.to_csv(f, index=False, chunksize=_CSV_CHUNK_ROWS)
+
+
+# Directories this session has already created
+_CREATED_DIRS = set()
+
+
+def _ensure_dir(path: str):
+    """Create a directory tree once; later calls only confirm it still exists."""
+    if path in _CREATED_DIRS and os.path.isdir(path):
+        return
+    os.makedirs(path, exist_ok=True)
+    _CREATED_DIRS.add(path)
+
+
+# Charts already rendered this session: input hash -> (saved files, modification time per path);
+# bounded so long-running processes rendering many results don't grow it forever
+_RENDERED_CHARTS: Dict[str, Tuple[Dict[str, str], Dict[str, float]]] = {}
+_RENDERED_CHARTS_SIZE = 128
+
+
+def _chart_inputs_key(model_data: pd.DataFrame,
+                      hotspot_stats: Optional[List[Dict]],
+                      persona_stats: Optional[Dict],
+                      output_dir: str) -> Optional[str]:
+    """Hash everything that determines the rendered charts, or None if unhashable."""
+    try:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(pd.util.hash_pandas_object(model_data, index=True).to_numpy().tobytes())
+        digest.update(json.dumps([list(map(str, model_data.columns)), hotspot_stats, persona_stats, output_dir],
+                                 sort_keys=True, default=str).encode())
+    except TypeError:
+        return None
+    return digest.hexdigest()
+
+
+def _cached_charts(cache_key: Optional[str]) -> Optional[Dict[str, str]]:
+    """Return saved chart paths for these inputs if every file is still as rendered."""
+    rendered = _RENDERED_CHARTS.get(cache_key) if cache_key else None
+    if rendered is None:
+        return None
+    saved_files, mtimes = rendered
+    for path, mtime in mtimes.items():
+        if not os.path.exists(path) or os.path.getmtime(path) != mtime:
+            return None
+    return dict(saved_files)
+
+
+def _remember_charts(cache_key: str, saved_files: Dict[str, str]):
+    """Record freshly rendered chart paths and their modification times."""
+    if cache_key not in _RENDERED_CHARTS and len(_RENDERED_CHARTS) >= _RENDERED_CHARTS_SIZE:
+        # Evict the oldest render
+        del _RENDERED_CHARTS[next(iter(_RENDERED_CHARTS))]
+    _RENDERED_CHARTS[cache_key] = (
+        dict(saved_files),
+        {path: os.path.getmtime(path) for path in saved_files.values()}
+    )
+
+
+# Fewer charts than this are rendered in-process; a pool isn't worth it
+_MIN_PARALLEL_CHARTS = 2
+
+
+def _parallel_charts(n_charts: int) -> bool:
+    """
+    Whether to render charts in a worker pool scoped to one call.
+    
+    Workers are forked so they inherit the already imported plotting modules;
+    Mesa switches the global default to "spawn", which would re-import them
+    (and the calling script) in every worker. Forking is only safe on Linux,
+    so elsewhere, and on single-core machines, charts are rendered serially.
+    """
+    return (n_charts >= _MIN_PARALLEL_CHARTS and sys.platform.startswith("linux")
+            and (os.cpu_count() or 1) >= 2)
+
+
+def _render_chart(renderer: str, data: Any, title: str, save_path: str) -> str:
+    """Render one chart to its file on a pyplot-free figure (chart worker)."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from . import visualization
+    
+    # Never registered with pyplot, so there is nothing to close afterwards
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    getattr(visualization, renderer)(data, title=title, save_path=save_path, fig=fig)
+    return save_path
 
 
 def quick_visualize_simulation(model_data: pd.DataFrame,
@@ -36,60 +246,82 @@ def quick_visualize_simulation(model_data: pd.DataFrame,
     Returns:
         Dictionary with paths to saved chart files
     """
+    # Identical inputs already rendered to this directory need no re-render
+    cache_key = None if show_plots else _chart_inputs_key(model_data, hotspot_stats, persona_stats, output_dir)
+    cached_files = _cached_charts(cache_key)
+    if cached_files is not None:
+        print(f"✅ Charts unchanged, reusing {output_dir}/")
+        return cached_files
+    
+    # Charting libraries are only loaded when charts are actually drawn
+    from . import visualization
+    
     # Create output directory
-    os.makedirs(output_dir, exist_ok=True)
+    _ensure_dir(output_dir)
     
     saved_files = {}
+    paths = _output_paths(output_dir, _CHART_FILES)
+    
+    # (key, progress message, renderer, data, title, save path) per chart;
+    # the popularity chart only reads Average_Popularity
+    charts = [(
+        "popularity", "📊 Creating popularity evolution chart...", "create_popularity_chart",
+        model_data.filter(items=['Average_Popularity']), "Tourism Hotspot Popularity Evolution",
+        paths["popularity"]
+    )]
+    if persona_stats:
+        charts.append((
+            "satisfaction", "📊 Creating satisfaction by persona chart...", "create_satisfaction_chart",
+            persona_stats, "Tourist Satisfaction by Persona",
+            paths["satisfaction"]
+        ))
+    charts.append((
+        "dashboard", "📊 Creating time series dashboard...", "create_time_series_dashboard",
+        model_data, "Tourism Simulation Dashboard",
+        paths["dashboard"]
+    ))
     
     try:
-        # 1. Popularity evolution chart
-        print("📊 Creating popularity evolution chart...")
-        fig1 = create_popularity_chart(
-            model_data,
-            title="Tourism Hotspot Popularity Evolution",
-            save_path=f"{output_dir}/popularity_evolution.png"
-        )
-        saved_files["popularity"] = f"{output_dir}/popularity_evolution.png"
-        
-        if show_plots:
-            plt.show()
-        plt.close(fig1)
-        
-        # 2. Satisfaction by persona chart
-        if persona_stats:
-            print("📊 Creating satisfaction by persona chart...")
-            fig2 = create_satisfaction_chart(
-                persona_stats,
-                title="Tourist Satisfaction by Persona",
-                save_path=f"{output_dir}/satisfaction_by_persona.png"
-            )
-            saved_files["satisfaction"] = f"{output_dir}/satisfaction_by_persona.png"
-            
-            if show_plots:
+        if not show_plots and _parallel_charts(len(charts)):
+            # The charts share no state, so each renders in its own worker;
+            # the pool lives only for this call
+            with ProcessPoolExecutor(max_workers=len(charts),
+                                     mp_context=multiprocessing.get_context("fork")) as executor:
+                futures = {}
+                for key, message, renderer, data, title, save_path in charts:
+                    print(message)
+                    futures[key] = executor.submit(_render_chart, renderer, data, title, save_path)
+                for key, future in futures.items():
+                    saved_files[key] = future.result()
+        elif show_plots:
+            # Figures must stay in this process to be shown
+            import matplotlib.pyplot as plt
+            for key, message, renderer, data, title, save_path in charts:
+                print(message)
+                fig = getattr(visualization, renderer)(data, title=title, save_path=save_path)
+                saved_files[key] = save_path
                 plt.show()
-            plt.close(fig2)
-        
-        # 3. Time series dashboard
-        print("📊 Creating time series dashboard...")
-        fig3 = create_time_series_dashboard(
-            model_data,
-            title="Tourism Simulation Dashboard",
-            save_path=f"{output_dir}/simulation_dashboard.png"
-        )
-        saved_files["dashboard"] = f"{output_dir}/simulation_dashboard.png"
-        
-        if show_plots:
-            plt.show()
-        plt.close(fig3)
+                plt.close(fig)
+        else:
+            for key, message, renderer, data, title, save_path in charts:
+                print(message)
+                saved_files[key] = _render_chart(renderer, data, title, save_path)
         
-        # 4. Save all charts automatically
+        # Save any charts beyond the three above
         print("📊 Saving additional charts...")
         results = {
             'model_data': model_data,
             'hotspot_stats': hotspot_stats or [],
             'persona_stats': persona_stats or {}
         }
-        save_all_charts(results, output_dir)
+        visualization.save_all_charts(
+            results,
+            output_dir,
+            skip=_CHART_NAMES
+        )
+        
+        if cache_key is not None:
+            _remember_charts(cache_key, saved_files)
         
         print(f"✅ All charts saved to {output_dir}/")
         
@@ -113,50 +345,48 @@ def quick_compare_scenarios(scenario_results: List[Dict[str, Any]],
     Returns:
         Dictionary with paths to saved chart files
     """
+    import matplotlib.pyplot as plt
     from .visualization import create_scenario_comparison
     
     # Create output directory
-    os.makedirs(output_dir, exist_ok=True)
+    _ensure_dir(output_dir)
     
     saved_files = {}
+    paths = _output_paths(output_dir, _COMPARISON_FILES)
     
     try:
         print("📊 Creating scenario comparison chart...")
-        # Convert results to the format expected by create_scenario_comparison
+        # Walk the results once for both the chart input and the comparison table
         scenario_results_for_comparison = []
+        comparison_rows = []
         for result in scenario_results:
+            scenario_name = result.get('name', 'Unknown')
+            metrics = result.get('summary', {}).get('final_metrics', {})
             scenario_results_for_comparison.append({
-                'scenario_name': result.get('name', 'Unknown'),
-                'final_metrics': result.get('summary', {}).get('final_metrics', {})
+                'scenario_name': scenario_name,
+                'final_metrics': metrics
             })
+            comparison_rows.append((scenario_name, *[metrics.get(metric, 0) for metric in _COMPARISON_METRICS]))
         
         fig = create_scenario_comparison(
             scenario_results_for_comparison,
-            metrics=['avg_popularity', 'total_visitors', 'social_shares', 'avg_satisfaction'],
+            metrics=list(_COMPARISON_METRICS),
             title="Scenario Performance Comparison",
-            save_path=f"{output_dir}/scenario_comparison.png"
+            save_path=paths["comparison"]
         )
-        saved_files["comparison"] = f"{output_dir}/scenario_comparison.png"
+        saved_files["comparison"] = paths["comparison"]
         
         if show_plots:
             plt.show()
         plt.close(fig)
         
         # Create comparison table
-        comparison_data = []
-        for result in scenario_results:
-            metrics = result.get('summary', {}).get('final_metrics', {})
-            comparison_data.append({
-                'Scenario': result.get('name', 'Unknown'),
-                'Avg_Popularity': metrics.get('avg_popularity', 0),
-                'Total_Visitors': metrics.get('total_visitors', 0),
-                'Social_Shares': metrics.get('social_shares', 0),
-                'Avg_Satisfaction': metrics.get('avg_satisfaction', 0)
-            })
-        
-        comparison_df = pd.DataFrame(comparison_data)
-        comparison_df.to_csv(f"{output_dir}/scenario_comparison.csv", index=False)
-        saved_files["comparison_table"] = f"{output_dir}/scenario_comparison.csv"
+        comparison_df = pd.DataFrame.from_records(
+            comparison_rows,
+            columns=['Scenario', 'Avg_Popularity', 'Total_Visitors', 'Social_Shares', 'Avg_Satisfaction']
+        )
+        comparison_df.to_csv(paths["comparison_table"], index=False)
+        saved_files["comparison_table"] = paths["comparison_table"]
         
         print(f"✅ Scenario comparison saved to {output_dir}/")
         
@@ -183,41 +413,58 @@ def quick_summary_report(model_data: pd.DataFrame,
         Path to the saved summary file
     """
     try:
-        with open(output_file, 'w') as f:
-            f.write("TOURISM SIMULATION SUMMARY REPORT\n")
-            f.write("=" * 40 + "\n\n")
-            
-            # Final metrics
-            if not model_data.empty:
-                final_metrics = model_data.iloc[-1]
-                f.write("FINAL METRICS:\n")
-                f.write("-" * 15 + "\n")
-                f.write(f"Average Popularity: {final_metrics.get('Average_Popularity', 0):.3f}\n")
-                f.write(f"Total Visitors: {int(final_metrics.get('Total_Visitors', 0))}\n")
-                f.write(f"Social Shares: {int(final_metrics.get('Social_Shares', 0))}\n")
-                f.write(f"Average Satisfaction: {final_metrics.get('Average_Satisfaction', 0):.3f}\n\n")
+        # The report is assembled in memory and written with a single call
+        parts = ["TOURISM SIMULATION SUMMARY REPORT\n", "=" * 40 + "\n\n"]
+        
+        # Final metrics
+        if not model_data.empty:
+            # Read the last row of the reported columns as one array
+            metric_columns = [column for column in _SUMMARY_METRIC_COLUMNS if column in model_data.columns]
+            final_metrics = dict(zip(metric_columns,
+                                     model_data[metric_columns].iloc[-1:].to_numpy()[0]))
+            parts.append("FINAL METRICS:\n")
+            parts.append("-" * 15 + "\n")
+            parts.append(f"Average Popularity: {final_metrics.get('Average_Popularity', 0):.3f}\n")
+            parts.append(f"Total Visitors: {int(final_metrics.get('Total_Visitors', 0))}\n")
+            parts.append(f"Social Shares: {int(final_metrics.get('Social_Shares', 0))}\n")
+            parts.append(f"Average Satisfaction: {final_metrics.get('Average_Satisfaction', 0):.3f}\n\n")
+        
+        # Top hotspots
+        if hotspot_stats:
+            parts.append("TOP PERFORMING HOTSPOTS:\n")
+            parts.append("-" * 25 + "\n")
+            popularity = np.fromiter((h.get('current_popularity', 0) for h in hotspot_stats),
+                                     dtype=np.float64, count=len(hotspot_stats))
             
-            # Top hotspots
-            if hotspot_stats:
-                f.write("TOP PERFORMING HOTSPOTS:\n")
-                f.write("-" * 25 + "\n")
-                sorted_hotspots = sorted(hotspot_stats, key=lambda x: x.get('current_popularity', 0), reverse=True)
-                
-                for i, hotspot in enumerate(sorted_hotspots[:5], 1):
-                    f.write(f"{i}. {hotspot.get('name', 'Unknown')}\n")
-                    f.write(f"   Popularity: {hotspot.get('current_popularity', 0):.3f}\n")
-                    f.write(f"   Visitors: {hotspot.get('total_visitors', 0)}\n")
-                    f.write(f"   Category: {hotspot.get('category', 'unknown')}\n\n")
+            top_hotspots = [hotspot_stats[index] for index in _top_indices(popularity, 5)]
             
-            # Persona analysis
-            if persona_stats:
-                f.write("PERSONA ANALYSIS:\n")
-                f.write("-" * 16 + "\n")
-                for persona, stats in persona_stats.items():
-                    f.write(f"{persona}:\n")
-                    f.write(f"   Count: {stats.get('count', 0)}\n")
-                    f.write(f"   Avg Satisfaction: {stats.get('avg_satisfaction', 0):.3f}\n")
-                    f.write(f"   Avg Visits: {stats.get('avg_visits', 0):.1f}\n\n")
+            parts.extend(
+                _HOTSPOT_ENTRY.format(
+                    i,
+                    hotspot.get('name', 'Unknown'),
+                    hotspot.get('current_popularity', 0),
+                    hotspot.get('total_visitors', 0),
+                    hotspot.get('category', 'unknown')
+                )
+                for i, hotspot in enumerate(top_hotspots, 1)
+            )
+        
+        # Persona analysis
+        if persona_stats:
+            parts.append("PERSONA ANALYSIS:\n")
+            parts.append("-" * 16 + "\n")
+            parts.extend(
+                _PERSONA_ENTRY.format(
+                    persona,
+                    stats.get('count', 0),
+                    stats.get('avg_satisfaction', 0),
+                    stats.get('avg_visits', 0)
+                )
+                for persona, stats in persona_stats.items()
+            )
+        
+        with open(output_file, 'w') as f:
+            f.write("".join(parts))
         
         print(f"✅ Summary report saved to {output_file}")
         return output_file
@@ -250,9 +497,8 @@ def add_visualization_to_existing_simulation(model_data: pd.DataFrame,
     data_dir = f"{output_dir}/data"
     reports_dir = f"{output_dir}/reports"
     
-    os.makedirs(charts_dir, exist_ok=True)
-    os.makedirs(data_dir, exist_ok=True)
-    os.makedirs(reports_dir, exist_ok=True)
+    for directory in (charts_dir, data_dir, reports_dir):
+        _ensure_dir(directory)
     
     all_files = {}
     
@@ -270,22 +516,25 @@ def add_visualization_to_existing_simulation(model_data: pd.DataFrame,
     if summary_file:
         all_files["summary"] = summary_file
     
-    # Save data files
+    # Save data files; each is an independent write, so they overlap on threads
+    data_paths = _output_paths(data_dir, _DATA_FILES)
+    writes = {}
     if not model_data.empty:
-        model_data.to_csv(f"{data_dir}/model_data.csv", index=False)
-        all_files["model_data"] = f"{data_dir}/model_data.csv"
-    
+        writes["model_data"] = (_write_model_csv, model_data)
     if hotspot_stats:
-        import json
-        with open(f"{data_dir}/hotspot_stats.json", 'w') as f:
-            json.dump(hotspot_stats, f, indent=2)
-        all_files["hotspot_stats"] = f"{data_dir}/hotspot_stats.json"
-    
+        writes["hotspot_stats"] = (_write_json, hotspot_stats)
     if persona_stats:
-        import json
-        with open(f"{data_dir}/persona_stats.json", 'w') as f:
-            json.dump(persona_stats, f, indent=2)
-        all_files["persona_stats"] = f"{data_dir}/persona_stats.json"
+        writes["persona_stats"] = (_write_json, persona_stats)
+    
+    if writes:
+        with ThreadPoolExecutor(max_workers=len(writes)) as executor:
+            futures = {
+                key: executor.submit(write, data, data_paths[key])
+                for key, (write, data) in writes.items()
+            }
+        for key, future in futures.items():
+            future.result()
+            all_files[key] = data_paths[key]
     
     print(f"✅ All visualization outputs saved to {output_dir}/")
     print(f"📊 Generated {len(all_files)} files")
@@ -6,10 +6,207 @@ This module provides utilities for easily creating and comparing
 multiple distinctive scenarios with different effects and characteristics.
 """
 
-from typing import List, Dict, Any, Optional
+import threading
+from functools import lru_cache
+from types import MappingProxyType
+import numpy as np
+from typing import List, Dict, Any, Optional, Tuple
 from sim.models.scenario_manager import TourismScenario
 
 
+def _frozen(config: Dict[str, Any]) -> MappingProxyType:
+    """Recursively wrap a nested config literal in read-only mapping proxies."""
+    return MappingProxyType({
+        key: _frozen(value) if isinstance(value, dict) else value
+        for key, value in config.items()
+    })
+
+
+# Marketing campaign settings by intensity
+_MARKETING_CONFIGS = _frozen({
+    "low": {"appeal_boosts": (0.2, 0.1), "external_factors": {"event_excitement": 0.2}},
+    "medium": {"appeal_boosts": (0.4, 0.3, 0.2), "external_factors": {"event_excitement": 0.4, "social_media_buzz": 0.3}},
+    "high": {"appeal_boosts": (0.6, 0.5, 0.3), "external_factors": {"event_excitement": 0.6, "social_media_buzz": 0.5, "cultural_curiosity": 0.4}},
+    "aggressive": {"appeal_boosts": (0.8, 0.6, 0.4), "external_factors": {"event_excitement": 0.8, "social_media_buzz": 0.7, "cultural_curiosity": 0.6}}
+})
+
+# Festival settings by scale
+_FESTIVAL_CONFIGS = _frozen({
+    "small": {"appeal_boost": 0.4, "capacity_multiplier": 1.5, "external_factors": {"artistic_excitement": 0.3}},
+    "medium": {"appeal_boost": 0.6, "capacity_multiplier": 2.0, "external_factors": {"artistic_excitement": 0.5, "social_media_buzz": 0.4}},
+    "large": {"appeal_boost": 0.8, "capacity_multiplier": 2.5, "external_factors": {"artistic_excitement": 0.7, "social_media_buzz": 0.6, "cultural_curiosity": 0.5}},
+    "major": {"appeal_boost": 1.0, "capacity_multiplier": 3.0, "external_factors": {"artistic_excitement": 0.9, "social_media_buzz": 0.8, "cultural_curiosity": 0.7}}
+})
+
+# Construction disruption settings by severity
+_CONSTRUCTION_CONFIGS = _frozen({
+    "light": {"appeal_penalties": (-0.2, -0.1), "external_factors": {"inconvenience_tolerance": -0.2}},
+    "medium": {"appeal_penalties": (-0.4, -0.3, -0.2), "external_factors": {"inconvenience_tolerance": -0.4, "noise_tolerance": -0.3}},
+    "heavy": {"appeal_penalties": (-0.6, -0.5, -0.3), "external_factors": {"inconvenience_tolerance": -0.6, "noise_tolerance": -0.5, "event_excitement": -0.3}},
+    "severe": {"appeal_penalties": (-0.8, -0.7, -0.5), "external_factors": {"inconvenience_tolerance": -0.8, "noise_tolerance": -0.7, "event_excitement": -0.5}}
+})
+
+# Policy (impact, external factors) by (policy type, target); penalties and boosts
+# share one signed impact
+_POLICY_TABLE = MappingProxyType({
+    ("tax", "luxury"): (-0.4, (("cost_sensitivity", 0.4),)),
+    ("tax", "budget"): (-0.2, (("cost_sensitivity", 0.6),)),
+    ("tax", "all"): (-0.3, (("cost_sensitivity", 0.5),)),
+    ("regulation", "luxury"): (-0.3, (("event_excitement", -0.2),)),
+    ("regulation", "budget"): (-0.1, (("event_excitement", -0.1),)),
+    ("regulation", "all"): (-0.2, (("event_excitement", -0.15),)),
+    ("subsidy", "luxury"): (0.2, (("event_excitement", 0.2),)),
+    ("subsidy", "budget"): (0.4, (("event_excitement", 0.3),)),
+    ("subsidy", "all"): (0.3, (("event_excitement", 0.25),)),
+    ("ban", "luxury"): (-0.6, (("event_excitement", -0.4),)),
+    ("ban", "budget"): (-0.3, (("event_excitement", -0.2),)),
+    ("ban", "all"): (-0.5, (("event_excitement", -0.3),))
+})
+_DEFAULT_POLICY = (-0.3, ())
+
+
+# Immutable scenario content: (description, target_demographics, events, external_factors),
+# where each event is (step, type, target, parameter items, description, reasoning)
+ScenarioSpec = Tuple[str, Tuple[str, ...], Tuple[tuple, ...], Tuple[Tuple[str, float], ...]]
+
+
+def _phase_steps(count: int) -> List[int]:
+    """Start steps of consecutive campaign phases: step 3, then every 5 steps."""
+    return (3 + 5 * np.arange(count)).tolist()
+
+
+def _scenario_from_spec(name: str, category: str, duration_steps: int, spec: ScenarioSpec) -> TourismScenario:
+    """Build a fresh, independently mutable scenario from a cached spec."""
+    description, target_demographics, events, external_factors = spec
+    return TourismScenario(
+        name=name,
+        category=category,
+        description=description,
+        duration_steps=duration_steps,
+        target_demographics=list(target_demographics),
+        events=[
+            {
+                "step": step,
+                "type": event_type,
+                "target": target,
+                "parameters": dict(parameters),
+                "description": event_description,
+                "reasoning": reasoning
+            }
+            for step, event_type, target, parameters, event_description, reasoning in events
+        ],
+        external_factors=dict(external_factors)
+    )
+
+
+# Baseline content: no events, demographics or external factors
+_BASELINE_SPEC: ScenarioSpec = ("Standard tourism conditions without any interventions", (), (), ())
+
+
+@lru_cache(maxsize=128)
+def _marketing_spec(intensity: str) -> ScenarioSpec:
+    """Scenario content for a marketing campaign of the given intensity."""
+    config = _MARKETING_CONFIGS.get(intensity, _MARKETING_CONFIGS["medium"])
+
+    # Marketing events
+    boosts = config["appeal_boosts"]
+    events = tuple(
+        (step, "appeal_boost", "all", (("appeal_boost", boost),),
+         f"Marketing campaign phase {i+1}", f"Promotional activities with {boost:.1f} appeal boost")
+        for i, (step, boost) in enumerate(zip(_phase_steps(len(boosts)), boosts))
+    )
+
+    return (
+        f"{intensity.title()} marketing campaign targeting all demographics",
+        ("Cultural Explorer", "Budget Backpacker", "Adventure Seeker", "Luxury Traveler"),
+        events,
+        tuple(config["external_factors"].items())
+    )
+
+
+@lru_cache(maxsize=128)
+def _festival_spec(scale: str) -> ScenarioSpec:
+    """Scenario content for a cultural festival of the given scale."""
+    config = _FESTIVAL_CONFIGS.get(scale, _FESTIVAL_CONFIGS["medium"])
+
+    events = (
+        # Festival opening
+        (5, "appeal_boost", "City Center", (("appeal_boost", config["appeal_boost"]),),
+         "Festival opening ceremony", f"Major festival creates {config['appeal_boost']:.1f} appeal boost"),
+        (5, "capacity_boost", "City Center", (("capacity_multiplier", config["capacity_multiplier"]),),
+         "Festival infrastructure deployment", f"Extensive facilities with {config['capacity_multiplier']:.1f}x capacity"),
+        # Spillover effects
+        (10, "appeal_boost", "Art Gallery District", (("appeal_boost", config["appeal_boost"] * 0.7),),
+         "Festival spillover effects", "Festival attendees visit nearby cultural venues"),
+        # Festival ends
+        (15, "appeal_reset", "City Center", (),
+         "Festival ends", "Festival concludes, appeal returns to baseline")
+    )
+
+    return (
+        f"{scale.title()} cultural festival with extensive programming",
+        ("Cultural Explorer", "Budget Backpacker", "Adventure Seeker"),
+        events,
+        tuple(config["external_factors"].items())
+    )
+
+
+@lru_cache(maxsize=128)
+def _construction_spec(severity: str) -> ScenarioSpec:
+    """Scenario content for construction disruption of the given severity."""
+    config = _CONSTRUCTION_CONFIGS.get(severity, _CONSTRUCTION_CONFIGS["medium"])
+
+    # Construction phases
+    penalties = config["appeal_penalties"]
+    events = tuple(
+        (step, "appeal_boost", "all", (("appeal_boost", penalty),),
+         f"Construction phase {i+1}", f"Construction work with {abs(penalty):.1f} appeal penalty")
+        for i, (step, penalty) in enumerate(zip(_phase_steps(len(penalties)), penalties))
+    )
+
+    return (
+        f"{severity.title()} construction project causing significant disruption",
+        (),
+        events,
+        tuple(config["external_factors"].items())
+    )
+
+
+@lru_cache(maxsize=128)
+def _policy_spec(policy_type: str, target: str) -> ScenarioSpec:
+    """Scenario content for a policy intervention on the given target."""
+    impact, external_factors = _POLICY_TABLE.get((policy_type, target), _DEFAULT_POLICY)
+
+    # Policy implementation
+    events = (
+        (5, "appeal_boost", "all", (("appeal_boost", impact),),
+         f"{policy_type.title()} implementation", f"Policy affects {target} tourism with {abs(impact):.1f} impact"),
+    )
+
+    return (
+        f"{policy_type.title()} policy targeting {target} tourism",
+        ("Luxury Traveler",) if target == "luxury" else ("Budget Backpacker",) if target == "budget" else (),
+        events,
+        external_factors
+    )
+
+
+@lru_cache(maxsize=128)
+def _comparison_set_specs(include_baseline: bool,
+                          marketing_intensity: str,
+                          festival_scale: str,
+                          construction_severity: str) -> Tuple[Tuple[str, str, ScenarioSpec], ...]:
+    """(name, category, spec) for every scenario of a standard comparison set."""
+    baseline = (("Baseline", "baseline", _BASELINE_SPEC),) if include_baseline else ()
+    return baseline + (
+        ("Marketing Campaign", "marketing", _marketing_spec(marketing_intensity)),
+        ("Cultural Festival", "cultural-event", _festival_spec(festival_scale)),
+        ("Construction Disruption", "infrastructure", _construction_spec(construction_severity)),
+        ("Luxury Tax", "policy", _policy_spec("tax", "luxury")),
+        ("Sustainable Initiative", "policy", _policy_spec("subsidy", "budget"))
+    )
+
+
 class ScenarioBuilder:
     """
     Utility class for building and managing multiple scenarios for comparison.
@@ -20,13 +217,7 @@ class ScenarioBuilder:
     
     def add_baseline(self, name: str = "Baseline", duration_steps: int = 20) -> TourismScenario:
         """Add a baseline scenario with no interventions."""
-        baseline = TourismScenario(
-            name=name,
-            category="baseline",
-            description="Standard tourism conditions without any interventions",
-            duration_steps=duration_steps,
-            target_demographics=[]
-        )
+        baseline = _scenario_from_spec(name, "baseline", duration_steps, _BASELINE_SPEC)
         self.scenarios.append(baseline)
         return baseline
     
@@ -42,39 +233,7 @@ class ScenarioBuilder:
             intensity: "low", "medium", "high", or "aggressive"
             duration_steps: Simulation duration
         """
-        intensity_configs = {
-            "low": {"appeal_boosts": [0.2, 0.1], "external_factors": {"event_excitement": 0.2}},
-            "medium": {"appeal_boosts": [0.4, 0.3, 0.2], "external_factors": {"event_excitement": 0.4, "social_media_buzz": 0.3}},
-            "high": {"appeal_boosts": [0.6, 0.5, 0.3], "external_factors": {"event_excitement": 0.6, "social_media_buzz": 0.5, "cultural_curiosity": 0.4}},
-            "aggressive": {"appeal_boosts": [0.8, 0.6, 0.4], "external_factors": {"event_excitement": 0.8, "social_media_buzz": 0.7, "cultural_curiosity": 0.6}}
-        }
-        
-        config = intensity_configs.get(intensity, intensity_configs["medium"])
-        
-        scenario = TourismScenario(
-            name=name,
-            category="marketing",
-            description=f"{intensity.title()} marketing campaign targeting all demographics",
-            duration_steps=duration_steps,
-            target_demographics=["Cultural Explorer", "Budget Backpacker", "Adventure Seeker", "Luxury Traveler"]
-        )
-        
-        # Add marketing events
-        for i, boost in enumerate(config["appeal_boosts"]):
-            step = 3 + i * 5
-            scenario.add_event(
-                step=step,
-                event_type="appeal_boost",
-                target="all",
-                parameters={"appeal_boost": boost},
-                description=f"Marketing campaign phase {i+1}",
-                reasoning=f"Promotional activities with {boost:.1f} appeal boost"
-            )
-        
-        # Add external factors
-        for factor, value in config["external_factors"].items():
-            scenario.add_external_factor(factor, value)
-        
+        scenario = _scenario_from_spec(name, "marketing", duration_steps, _marketing_spec(intensity))
         self.scenarios.append(scenario)
         return scenario
     
@@ -90,66 +249,7 @@ class ScenarioBuilder:
             scale: "small", "medium", "large", or "major"
             duration_steps: Simulation duration
         """
-        scale_configs = {
-            "small": {"appeal_boost": 0.4, "capacity_multiplier": 1.5, "external_factors": {"artistic_excitement": 0.3}},
-            "medium": {"appeal_boost": 0.6, "capacity_multiplier": 2.0, "external_factors": {"artistic_excitement": 0.5, "social_media_buzz": 0.4}},
-            "large": {"appeal_boost": 0.8, "capacity_multiplier": 2.5, "external_factors": {"artistic_excitement": 0.7, "social_media_buzz": 0.6, "cultural_curiosity": 0.5}},
-            "major": {"appeal_boost": 1.0, "capacity_multiplier": 3.0, "external_factors": {"artistic_excitement": 0.9, "social_media_buzz": 0.8, "cultural_curiosity": 0.7}}
-        }
-        
-        config = scale_configs.get(scale, scale_configs["medium"])
-        
-        scenario = TourismScenario(
-            name=name,
-            category="cultural-event",
-            description=f"{scale.title()} cultural festival with extensive programming",
-            duration_steps=duration_steps,
-            target_demographics=["Cultural Explorer", "Budget Backpacker", "Adventure Seeker"]
-        )
-        
-        # Festival opening
-        scenario.add_event(
-            step=5,
-            event_type="appeal_boost",
-            target="City Center",
-            parameters={"appeal_boost": config["appeal_boost"]},
-            description="Festival opening ceremony",
-            reasoning=f"Major festival creates {config['appeal_boost']:.1f} appeal boost"
-        )
-        
-        scenario.add_event(
-            step=5,
-            event_type="capacity_boost",
-            target="City Center",
-            parameters={"capacity_multiplier": config["capacity_multiplier"]},
-            description="Festival infrastructure deployment",
-            reasoning=f"Extensive facilities with {config['capacity_multiplier']:.1f}x capacity"
-        )
-        
-        # Spillover effects
-        scenario.add_event(
-            step=10,
-            event_type="appeal_boost",
-            target="Art Gallery District",
-            parameters={"appeal_boost": config["appeal_boost"] * 0.7},
-            description="Festival spillover effects",
-            reasoning="Festival attendees visit nearby cultural venues"
-        )
-        
-        # Festival ends
-        scenario.add_event(
-            step=15,
-            event_type="appeal_reset",
-            target="City Center",
-            parameters={},
-            description="Festival ends",
-            reasoning="Festival concludes, appeal returns to baseline"
-        )
-        
-        # Add external factors
-        for factor, value in config["external_factors"].items():
-            scenario.add_external_factor(factor, value)
-        
+        scenario = _scenario_from_spec(name, "cultural-event", duration_steps, _festival_spec(scale))
         self.scenarios.append(scenario)
         return scenario
     
@@ -165,39 +265,7 @@ class ScenarioBuilder:
             severity: "light", "medium", "heavy", or "severe"
             duration_steps: Simulation duration
         """
-        severity_configs = {
-            "light": {"appeal_penalties": [-0.2, -0.1], "external_factors": {"inconvenience_tolerance": -0.2}},
-            "medium": {"appeal_penalties": [-0.4, -0.3, -0.2], "external_factors": {"inconvenience_tolerance": -0.4, "noise_tolerance": -0.3}},
-            "heavy": {"appeal_penalties": [-0.6, -0.5, -0.3], "external_factors": {"inconvenience_tolerance": -0.6, "noise_tolerance": -0.5, "event_excitement": -0.3}},
-            "severe": {"appeal_penalties": [-0.8, -0.7, -0.5], "external_factors": {"inconvenience_tolerance": -0.8, "noise_tolerance": -0.7, "event_excitement": -0.5}}
-        }
-        
-        config = severity_configs.get(severity, severity_configs["medium"])
-        
-        scenario = TourismScenario(
-            name=name,
-            category="infrastructure",
-            description=f"{severity.title()} construction project causing significant disruption",
-            duration_steps=duration_steps,
-            target_demographics=[]
-        )
-        
-        # Construction phases
-        for i, penalty in enumerate(config["appeal_penalties"]):
-            step = 3 + i * 5
-            scenario.add_event(
-                step=step,
-                event_type="appeal_boost",
-                target="all",
-                parameters={"appeal_boost": penalty},
-                description=f"Construction phase {i+1}",
-                reasoning=f"Construction work with {abs(penalty):.1f} appeal penalty"
-            )
-        
-        # Add external factors
-        for factor, value in config["external_factors"].items():
-            scenario.add_external_factor(factor, value)
-        
+        scenario = _scenario_from_spec(name, "infrastructure", duration_steps, _construction_spec(severity))
         self.scenarios.append(scenario)
         return scenario
     
@@ -215,53 +283,7 @@ class ScenarioBuilder:
             target: "luxury", "budget", "all", or specific target
             duration_steps: Simulation duration
         """
-        policy_configs = {
-            "tax": {
-                "luxury": {"appeal_penalty": -0.4, "external_factors": {"cost_sensitivity": 0.4}},
-                "budget": {"appeal_penalty": -0.2, "external_factors": {"cost_sensitivity": 0.6}},
-                "all": {"appeal_penalty": -0.3, "external_factors": {"cost_sensitivity": 0.5}}
-            },
-            "regulation": {
-                "luxury": {"appeal_penalty": -0.3, "external_factors": {"event_excitement": -0.2}},
-                "budget": {"appeal_penalty": -0.1, "external_factors": {"event_excitement": -0.1}},
-                "all": {"appeal_penalty": -0.2, "external_factors": {"event_excitement": -0.15}}
-            },
-            "subsidy": {
-                "luxury": {"appeal_boost": 0.2, "external_factors": {"event_excitement": 0.2}},
-                "budget": {"appeal_boost": 0.4, "external_factors": {"event_excitement": 0.3}},
-                "all": {"appeal_boost": 0.3, "external_factors": {"event_excitement": 0.25}}
-            },
-            "ban": {
-                "luxury": {"appeal_penalty": -0.6, "external_factors": {"event_excitement": -0.4}},
-                "budget": {"appeal_penalty": -0.3, "external_factors": {"event_excitement": -0.2}},
-                "all": {"appeal_penalty": -0.5, "external_factors": {"event_excitement": -0.3}}
-            }
-        }
-        
-        config = policy_configs.get(policy_type, {}).get(target, {"appeal_penalty": -0.3, "external_factors": {}})
-        
-        scenario = TourismScenario(
-            name=name,
-            category="policy",
-            description=f"{policy_type.title()} policy targeting {target} tourism",
-            duration_steps=duration_steps,
-            target_demographics=["Luxury Traveler"] if target == "luxury" else ["Budget Backpacker"] if target == "budget" else []
-        )
-        
-        # Policy implementation
-        scenario.add_event(
-            step=5,
-            event_type="appeal_boost",
-            target="all",
-            parameters={"appeal_boost": config.get("appeal_penalty", 0) or config.get("appeal_boost", 0)},
-            description=f"{policy_type.title()} implementation",
-            reasoning=f"Policy affects {target} tourism with {abs(config.get('appeal_penalty', 0) or config.get('appeal_boost', 0)):.1f} impact"
-        )
-        
-        # Add external factors
-        for factor, value in config["external_factors"].items():
-            scenario.add_external_factor(factor, value)
-        
+        scenario = _scenario_from_spec(name, "policy", duration_steps, _policy_spec(policy_type, target))
         self.scenarios.append(scenario)
         return scenario
     
@@ -333,20 +355,35 @@ class ScenarioBuilder:
             festival_scale: Scale of festival scenario
             construction_severity: Severity of construction scenario
         """
-        self.clear_scenarios()
-        
-        if include_baseline:
-            self.add_baseline()
-        
-        self.add_marketing_scenario(intensity=marketing_intensity)
-        self.add_festival_scenario(scale=festival_scale)
-        self.add_construction_scenario(severity=construction_severity)
-        self.add_policy_scenario(name="Luxury Tax", policy_type="tax", target="luxury")
-        self.add_policy_scenario(name="Sustainable Initiative", policy_type="subsidy", target="budget")
+        # The set's content is cached per argument combination; the scenarios
+        # themselves are rebuilt on every call so callers can modify them
+        specs = _comparison_set_specs(include_baseline, marketing_intensity, festival_scale, construction_severity)
+        self.scenarios = [
+            _scenario_from_spec(name, category, 20, spec)
+            for name, category, spec in specs
+        ]
         
         return self.get_scenarios()
 
 
+# Per-thread builder reused by the module-level comparison set functions
+_SHARED_BUILDERS = threading.local()
+
+
+def _shared_builder() -> ScenarioBuilder:
+    """
+    Return this thread's reusable builder.
+    
+    Building a comparison set assigns the builder a brand-new scenarios list
+    (create_comparison_set rebinds it, clear_scenarios() does too), so
+    lists returned earlier are never modified by later calls.
+    """
+    builder = getattr(_SHARED_BUILDERS, "builder", None)
+    if builder is None:
+        builder = _SHARED_BUILDERS.builder = ScenarioBuilder()
+    return builder
+
+
 def create_quick_comparison_set() -> List[TourismScenario]:
     """
     Create a quick set of scenarios for comparison.
@@ -354,8 +391,7 @@ def create_quick_comparison_set() -> List[TourismScenario]:
     Returns:
         List of TourismScenario objects
     """
-    builder = ScenarioBuilder()
-    return builder.create_comparison_set()
+    return _shared_builder().create_comparison_set()
 
 
 def create_extreme_comparison_set() -> List[TourismScenario]:
@@ -365,7 +401,7 @@ def create_extreme_comparison_set() -> List[TourismScenario]:
     Returns:
         List of TourismScenario objects
     """
-    builder = ScenarioBuilder()
+    builder = _shared_builder()
     builder.clear_scenarios()
     
     builder.add_baseline()
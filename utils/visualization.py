@@ -8,10 +8,11 @@ and scenario comparisons.
 """
 
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import seaborn as sns
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Set, Tuple
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -20,10 +21,19 @@ plt.style.use('seaborn-v0_8')
 sns.set_palette("husl")
 
 
+def _chart_figure(fig: Optional[Figure], figsize: Tuple[float, float]) -> Figure:
+    """Size a caller-supplied figure for a chart, or open a new pyplot figure."""
+    if fig is None:
+        return plt.figure(figsize=figsize)
+    fig.set_size_inches(figsize)
+    return fig
+
+
 def create_popularity_chart(model_data: pd.DataFrame, 
                           hotspot_data: Optional[pd.DataFrame] = None,
                           title: str = "Hotspot Popularity Evolution",
-                          save_path: Optional[str] = None) -> plt.Figure:
+                          save_path: Optional[str] = None,
+                          fig: Optional[Figure] = None) -> plt.Figure:
     """
     Create a line chart showing hotspot popularity evolution over time.
 
@@ -32,11 +42,14 @@ def create_popularity_chart(model_data: pd.DataFrame,
         hotspot_data: Optional DataFrame with hotspot-specific data  
         title: Chart title
         save_path: Optional path to save the chart
+        fig: Optional figure to draw on, e.g. a pyplot-free Figure
+            (a new pyplot figure by default)
 
     Returns:
         Matplotlib figure object
     """
-    fig, ax = plt.subplots(figsize=(12, 8))
+    fig = _chart_figure(fig, (12, 8))
+    ax = fig.subplots()
 
     if hotspot_data is not None and not hotspot_data.empty:
         # Plot individual hotspot popularity over time
@@ -58,17 +71,18 @@ def create_popularity_chart(model_data: pd.DataFrame,
     ax.set_title(title, fontsize=16, fontweight='bold')
     ax.grid(True, alpha=0.3)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        fig.savefig(save_path, dpi=300, bbox_inches='tight')
 
     return fig
 
 
 def create_satisfaction_chart(persona_stats: Dict[str, Dict[str, Any]], 
                             title: str = "Tourist Satisfaction by Persona",
-                            save_path: Optional[str] = None) -> plt.Figure:
+                            save_path: Optional[str] = None,
+                            fig: Optional[Figure] = None) -> plt.Figure:
     """
     Create a bar chart showing satisfaction levels by tourist persona.
 
@@ -76,11 +90,14 @@ def create_satisfaction_chart(persona_stats: Dict[str, Dict[str, Any]],
         persona_stats: Dictionary with persona statistics
         title: Chart title
         save_path: Optional path to save the chart
+        fig: Optional figure to draw on, e.g. a pyplot-free Figure
+            (a new pyplot figure by default)
 
     Returns:
         Matplotlib figure object
     """
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+    fig = _chart_figure(fig, (15, 6))
+    ax1, ax2 = fig.subplots(1, 2)
 
     # Extract data
     personas = list(persona_stats.keys())
@@ -114,11 +131,11 @@ def create_satisfaction_chart(persona_stats: Dict[str, Dict[str, Any]],
     for ax in [ax1, ax2]:
         ax.tick_params(axis='x', rotation=45)
 
-    plt.suptitle(title, fontsize=16, fontweight='bold')
-    plt.tight_layout()
+    fig.suptitle(title, fontsize=16, fontweight='bold')
+    fig.tight_layout()
 
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        fig.savefig(save_path, dpi=300, bbox_inches='tight')
 
     return fig
 
@@ -343,7 +360,8 @@ def plot_hotspot_map(hotspots_data: List[Dict[str, Any]],
 def create_time_series_dashboard(model_data: pd.DataFrame,
                                agent_data: Optional[pd.DataFrame] = None,
                                title: str = "Tourism Simulation Dashboard",
-                               save_path: Optional[str] = None) -> plt.Figure:
+                               save_path: Optional[str] = None,
+                               fig: Optional[Figure] = None) -> plt.Figure:
     """
     Create a comprehensive dashboard with multiple time series charts.
 
@@ -352,11 +370,13 @@ def create_time_series_dashboard(model_data: pd.DataFrame,
         agent_data: Optional DataFrame with agent-level data
         title: Dashboard title
         save_path: Optional path to save the dashboard
+        fig: Optional figure to draw on, e.g. a pyplot-free Figure
+            (a new pyplot figure by default)
 
     Returns:
         Matplotlib figure object
     """
-    fig = plt.figure(figsize=(16, 12))
+    fig = _chart_figure(fig, (16, 12))
 
     # Create grid layout
     gs = fig.add_gridspec(3, 2, hspace=0.3, wspace=0.3)
@@ -415,22 +435,26 @@ def create_time_series_dashboard(model_data: pd.DataFrame,
     ax5.legend()
     ax5.grid(True, alpha=0.3)
 
-    plt.suptitle(title, fontsize=16, fontweight='bold')
+    fig.suptitle(title, fontsize=16, fontweight='bold')
 
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        fig.savefig(save_path, dpi=300, bbox_inches='tight')
 
     return fig
 
 
-def save_all_charts(results: Dict[str, Any], output_dir: str = "charts"):
+def save_all_charts(results: Dict[str, Any], output_dir: str = "charts",
+                    skip: Optional[Set[str]] = None):
     """
     Generate and save all standard charts for a simulation run.
 
     Args:
         results: Dictionary with simulation results
         output_dir: Directory to save charts
+        skip: Chart names (file stems, e.g. "popularity_evolution") already
+            rendered by the caller and not to be drawn again
     """
+    skip = skip or set()
     import os
     os.makedirs(output_dir, exist_ok=True)
 
@@ -440,17 +464,17 @@ def save_all_charts(results: Dict[str, Any], output_dir: str = "charts"):
 
     try:
         # Popularity chart
-        if model_data is not None:
+        if model_data is not None and 'popularity_evolution' not in skip:
             fig1 = create_popularity_chart(model_data, save_path=f"{output_dir}/popularity_evolution.png")
             plt.close(fig1)
 
         # Satisfaction chart
-        if persona_stats:
+        if persona_stats and 'satisfaction_by_persona' not in skip:
             fig2 = create_satisfaction_chart(persona_stats, save_path=f"{output_dir}/satisfaction_by_persona.png")
             plt.close(fig2)
 
         # Dashboard
-        if model_data is not None:
+        if model_data is not None and 'simulation_dashboard' not in skip:
             fig3 = create_time_series_dashboard(model_data, save_path=f"{output_dir}/simulation_dashboard.png")
             plt.close(fig3)
 